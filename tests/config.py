@@ -2,7 +2,7 @@
 Configuration settings for OdiLeague Agentic Scraper
 """
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 @dataclass
 class ScraperConfig:
@@ -20,12 +20,15 @@ class ScraperConfig:
     
     # Scraping intervals (in seconds)
     TIMER_CHECK_INTERVAL: float = 0.5
+    TIMER_IDLE_INTERVAL: float = 5.0  # Longest poll while every timer is far from a threshold
     LIVE_MATCH_CHECK_INTERVAL: float = 2.0
     STANDINGS_MATCH_TRIGGER: int = 5  # Scrape standings every 5 matches
     
     # Browser settings
     HEADLESS: bool = False
     BROWSER_TIMEOUT: int = 60000  # 60 seconds
+    SETTLE_TIMEOUT: int = 5000  # Max wait for a tab/page to render after navigation (ms)
+    CDP_ENDPOINT: Optional[str] = None  # e.g. "http://localhost:9222" to reuse a running Chromium
     
     # Data storage
     DATA_DIR: str = "data"
@@ -1,14 +1,14 @@
 """
 Data storage agent - handles all data persistence with UPSERT logic
 """
-import json
+import orjson
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 import shutil
 
-from models import AgentState
+from models import AgentState, ResultData, StandingsData
 from logger import AgentLogger
 
 class DataAgent:
@@ -47,14 +47,14 @@ class DataAgent:
         
     async def initialize(self):
         """Initialize data agent - load existing data"""
-        self.logger.state_change(self.state.value, AgentState.INITIALIZING.value)
+        self.logger.state_change(self.state, AgentState.INITIALIZING)
         self.state = AgentState.INITIALIZING
         
         # Load existing data
         await self._load_data()
         
         self.state = AgentState.RUNNING
-        self.logger.state_change(AgentState.INITIALIZING.value, self.state.value)
+        self.logger.state_change(AgentState.INITIALIZING, self.state)
         self.logger.info("DataAgent ready")
         
     async def _load_data(self):
@@ -62,26 +62,26 @@ class DataAgent:
         async with self.lock:
             # Load matches
             if self.matches_file.exists():
-                with open(self.matches_file, 'r', encoding='utf-8') as f:
-                    self.matches_cache = json.load(f)
+                with open(self.matches_file, 'rb') as f:
+                    self.matches_cache = orjson.loads(f.read())
                 self.logger.info(f"Loaded {len(self.matches_cache)} matches from disk")
             
             # Load results
             if self.results_file.exists():
-                with open(self.results_file, 'r', encoding='utf-8') as f:
-                    self.results_cache = json.load(f)
+                with open(self.results_file, 'rb') as f:
+                    self.results_cache = orjson.loads(f.read())
                 self.logger.info(f"Loaded {len(self.results_cache)} results from disk")
             
             # Load standings
             if self.standings_file.exists():
-                with open(self.standings_file, 'r', encoding='utf-8') as f:
-                    self.standings_cache = json.load(f)
+                with open(self.standings_file, 'rb') as f:
+                    self.standings_cache = orjson.loads(f.read())
                 self.logger.info(f"Loaded standings data from disk")
             
             # Load leagues
             if self.leagues_file.exists():
-                with open(self.leagues_file, 'r', encoding='utf-8') as f:
-                    self.leagues_cache = json.load(f)
+                with open(self.leagues_file, 'rb') as f:
+                    self.leagues_cache = orjson.loads(f.read())
                 self.logger.info(f"Loaded league data from disk")
     
     async def save_matchday_data(self, match_id: str, data: Dict[str, Any]) -> bool:
@@ -122,6 +122,46 @@ class DataAgent:
                 self.logger.error(f"Failed to save matchday data: {e}", match_id=match_id)
                 return False
     
+    async def save_matchday_data_batch(self, match_id: str, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Apply several matchday snapshots for one match with a single file write
+        
+        Args:
+            match_id: Unique match identifier
+            batch: Matchday data dictionaries, oldest first
+            
+        Returns:
+            Success status
+        """
+        if not batch:
+            return True
+        
+        async with self.lock:
+            try:
+                now = datetime.now().isoformat()
+                
+                # UPSERT logic - the newest snapshot wins
+                if match_id in self.matches_cache:
+                    self.matches_cache[match_id]['matchday_data'] = batch[-1]
+                    self.matches_cache[match_id]['updated_at'] = now
+                else:
+                    self.matches_cache[match_id] = {
+                        'match_id': match_id,
+                        'matchday_data': batch[-1],
+                        'created_at': now,
+                        'updated_at': now
+                    }
+                
+                # Persist to disk once for the whole batch
+                await self._save_to_file(self.matches_file, self.matches_cache)
+                self.logger.info("Saved matchday batch", match_id=match_id, size=len(batch))
+                self.logger.data_collected("matchday", len(batch))
+                return True
+                
+            except Exception as e:
+                self.logger.error(f"Failed to save matchday batch: {e}", match_id=match_id)
+                return False
+    
     async def save_live_data(self, match_id: str, data: Dict[str, Any]) -> bool:
         """Save or update live match data"""
         async with self.lock:
@@ -145,8 +185,11 @@ class DataAgent:
                 self.logger.error(f"Failed to save live data: {e}", match_id=match_id)
                 return False
     
-    async def save_result(self, match_id: str, data: Dict[str, Any]) -> bool:
-        """Save final result"""
+    async def save_result(self, match_id: str, data: Union[ResultData, Dict[str, Any]]) -> bool:
+        """Save final result (a ResultData is converted so the caches always hold dicts)"""
+        if isinstance(data, ResultData):
+            data = data.to_dict()
+        
         async with self.lock:
             try:
                 # Update match cache
@@ -166,8 +209,11 @@ class DataAgent:
                 self.logger.error(f"Failed to save result: {e}", match_id=match_id)
                 return False
     
-    async def save_standings(self, league: str, data: Dict[str, Any]) -> bool:
-        """Save league standings"""
+    async def save_standings(self, league: str, data: Union[StandingsData, Dict[str, Any]]) -> bool:
+        """Save league standings (a StandingsData is converted so the caches always hold dicts)"""
+        if isinstance(data, StandingsData):
+            data = data.to_dict()
+        
         async with self.lock:
             try:
                 if league not in self.standings_cache:
@@ -213,8 +259,8 @@ class DataAgent:
         try:
             # Write to temporary file first
             temp_file = file_path.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             
             # Atomic rename
             temp_file.replace(file_path)
@@ -253,7 +299,7 @@ class DataAgent:
     
     async def shutdown(self):
         """Shutdown data agent"""
-        self.logger.state_change(self.state.value, AgentState.STOPPING.value)
+        self.logger.state_change(self.state, AgentState.STOPPING)
         self.state = AgentState.STOPPING
         
         # Final save
@@ -265,7 +311,7 @@ class DataAgent:
         await self.create_backup()
         
         self.state = AgentState.STOPPED
-        self.logger.state_change(AgentState.STOPPING.value, self.state.value)
+        self.logger.state_change(AgentState.STOPPING, self.state)
         self.logger.info("DataAgent shutdown complete")
 
 
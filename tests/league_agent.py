@@ -40,6 +40,10 @@ class LeagueAgent:
         self.matchday_agents: Dict[int, MatchdayAgent] = {}
         self.live_agents: Dict[int, LiveAgent] = {}
         
+        # Validation agents, reused for every completed match
+        self.results_agent = ResultsAgent(page, data_agent, self.league_id)
+        self.standings_agent = StandingsAgent(page, data_agent, self.league_id)
+        
         # Match tracking
         self.completed_matches = 0
         self.match_teams: Dict[int, tuple] = {}  # {index: (home, away)}
@@ -51,14 +55,14 @@ class LeagueAgent:
     
     async def initialize(self):
         """Initialize league agent"""
-        self.logger.state_change(self.state.value, AgentState.INITIALIZING.value)
+        self.logger.state_change(self.state, AgentState.INITIALIZING)
         
         try:
             # Select this league
             await self._select_league()
             
             self.state = AgentState.RUNNING
-            self.logger.state_change(AgentState.INITIALIZING.value, self.state.value)
+            self.logger.state_change(AgentState.INITIALIZING, self.state)
             self.logger.info(f"LeagueAgent ready")
             
         except Exception as e:
@@ -150,12 +154,12 @@ class LeagueAgent:
         try:
             matchday_agent = self.matchday_agents[match_index]
             
-            # Get team info before stopping
-            await self._cache_team_info(match_index, matchday_agent)
-            
-            # Stop agent
+            # Stop agent (flushes any buffered matchday saves)
             await matchday_agent.stop()
             
+            # Cache team info from the saved data
+            await self._cache_team_info(match_index, matchday_agent)
+            
             # Remove from active agents
             del self.matchday_agents[match_index]
             
@@ -270,16 +274,7 @@ class LeagueAgent:
     async def _validate_result(self, match_id: str, home_team: str, away_team: str):
         """Validate match result"""
         try:
-            results_agent = ResultsAgent(
-                page=self.page,
-                data_agent=self.data_agent,
-                league=self.league_id,
-                match_id=match_id,
-                home_team=home_team,
-                away_team=away_team
-            )
-            
-            await results_agent.validate_and_save()
+            await self.results_agent.validate_and_save(match_id, home_team, away_team)
             
         except Exception as e:
             self.logger.error(f"Error validating result: {e}")
@@ -292,20 +287,14 @@ class LeagueAgent:
                 trigger=f"{self.completed_matches} matches completed"
             )
             
-            standings_agent = StandingsAgent(
-                page=self.page,
-                data_agent=self.data_agent,
-                league=self.league_id
-            )
-            
-            await standings_agent.scrape_and_save()
+            await self.standings_agent.scrape_and_save()
             
         except Exception as e:
             self.logger.error(f"Error scraping standings: {e}")
     
     async def shutdown(self):
         """Shutdown league agent"""
-        self.logger.state_change(self.state.value, AgentState.STOPPING.value)
+        self.logger.state_change(self.state, AgentState.STOPPING)
         self.state = AgentState.STOPPING
         
         # Stop all matchday agents
@@ -320,5 +309,5 @@ class LeagueAgent:
         self.live_agents.clear()
         
         self.state = AgentState.STOPPED
-        self.logger.state_change(AgentState.STOPPING.value, self.state.value)
+        self.logger.state_change(AgentState.STOPPING, self.state)
         self.logger.info("LeagueAgent shutdown complete")
@@ -55,7 +55,7 @@ class LiveAgent:
     
     async def start(self):
         """Start tracking live match"""
-        self.logger.state_change(self.state.value, AgentState.RUNNING.value)
+        self.logger.state_change(self.state, AgentState.RUNNING)
         self.state = AgentState.RUNNING
         self.running = True
         
@@ -248,17 +248,18 @@ class LiveAgent:
                     minute = await elem.inner_text()
                     away_goals.append(minute.strip())
             
-            # Create goal events
+            # Create goal events (one timestamp for the whole pass)
             new_goals = []
+            timestamp = datetime.now().isoformat()
             
             for minute in home_goals:
-                goal = GoalEvent(team="home", minute=minute)
+                goal = GoalEvent(team="home", minute=minute, timestamp=timestamp)
                 if not self._goal_exists(goal):
                     new_goals.append(goal)
                     self.logger.info(f"⚽ GOAL! {self.home_team} at {minute}'")
             
             for minute in away_goals:
-                goal = GoalEvent(team="away", minute=minute)
+                goal = GoalEvent(team="away", minute=minute, timestamp=timestamp)
                 if not self._goal_exists(goal):
                     new_goals.append(goal)
                     self.logger.info(f"⚽ GOAL! {self.away_team} at {minute}'")
@@ -299,14 +300,14 @@ class LiveAgent:
     
     async def stop(self):
         """Stop live tracking"""
-        self.logger.state_change(self.state.value, AgentState.STOPPING.value)
+        self.logger.state_change(self.state, AgentState.STOPPING)
         self.state = AgentState.STOPPING
         self.running = False
         
         await asyncio.sleep(self.check_interval + 0.1)
         
         self.state = AgentState.STOPPED
-        self.logger.state_change(AgentState.STOPPING.value, self.state.value)
+        self.logger.state_change(AgentState.STOPPING, self.state)
         self.logger.info("LiveAgent stopped")
 
 
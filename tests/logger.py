@@ -84,44 +84,44 @@ class AgentLogger:
         self.agent_name = agent_name
         self.logger = setup_logger(agent_name, log_dir, level)
         
-    def debug(self, message: str, **kwargs):
-        """Log debug message"""
+    def _log(self, level: int, message: str, args: tuple, kwargs: dict):
+        """Format and emit a message only if the level is enabled"""
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
         extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
         full_message = f"{message} | {extra_info}" if extra_info else message
-        self.logger.debug(full_message)
+        self.logger.log(level, full_message)
+        
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message"""
+        self._log(logging.DEBUG, message, args, kwargs)
         
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message"""
-        extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_info}" if extra_info else message
-        self.logger.info(full_message)
+        self._log(logging.INFO, message, args, kwargs)
         
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message"""
-        extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_info}" if extra_info else message
-        self.logger.warning(full_message)
+        self._log(logging.WARNING, message, args, kwargs)
         
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message"""
-        extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_info}" if extra_info else message
-        self.logger.error(full_message)
+        self._log(logging.ERROR, message, args, kwargs)
         
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message"""
-        extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_info}" if extra_info else message
-        self.logger.critical(full_message)
+        self._log(logging.CRITICAL, message, args, kwargs)
         
     def state_change(self, old_state: str, new_state: str):
         """Log state transition"""
-        self.info(f"State transition: {old_state} → {new_state}")
+        self._log(logging.INFO, "State transition: %s → %s", (old_state, new_state), {})
         
     def agent_action(self, action: str, **details):
         """Log agent action"""
-        self.info(f"Action: {action}", **details)
+        self._log(logging.INFO, "Action: %s", (action,), details)
         
     def data_collected(self, data_type: str, count: int = 1):
         """Log data collection"""
-        self.info(f"Data collected: {data_type}", count=count)
+        self._log(logging.INFO, "Data collected: %s", (data_type,), {'count': count})
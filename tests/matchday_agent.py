@@ -3,15 +3,173 @@ Matchday Agent - scrapes pre-match data with enhanced features
 """
 import asyncio
 import hashlib
+import json
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Dict, List, Optional, Tuple, Callable
 from datetime import datetime
-from playwright.async_api import Page
+from playwright.async_api import Page, Browser, BrowserContext
 
-from models import AgentState, MatchdayData, TeamInfo, OddsData
+from models import AgentState, MatchdayData, MatchdayMetrics, TeamInfo, OddsData
 from logger import AgentLogger
 from config import config, selectors
 from data_agent import DataAgent
 
+try:
+    from xxhash import xxh3_64 as Fingerprint
+except ImportError:  # xxhash is optional - fall back to a 64-bit blake2b with the same interface
+    class Fingerprint:
+        """Minimal xxh3_64 stand-in: update() bytes, read an int with intdigest()"""
+        __slots__ = ('_hash',)
+        
+        def __init__(self, data: bytes = b""):
+            self._hash = hashlib.blake2b(data, digest_size=8)
+        
+        def update(self, data: bytes):
+            self._hash.update(data)
+        
+        def intdigest(self) -> int:
+            return int.from_bytes(self._hash.digest(), 'big')
+
+
+# Label/value pairs of every enabled odds button in a market section
+# (label and value are fetched with one combined query, in document order)
+ODDS_PAIRS_JS = """
+(sec) => Array.from(sec.querySelectorAll('button'))
+    .filter(b => !b.disabled)
+    .map(b => {
+        const n = b.querySelectorAll('small.o-1, span.o-2');
+        return [n[0]?.innerText, n[1]?.innerText];
+    })
+"""
+
+# Team names + enabled odds of one match, used to detect changes without a full scrape
+# (the timer is left out on purpose - it ticks every second)
+HEADER_JS = """
+([index, gameSel, teamSel, oddsSel]) => {
+    const game = document.querySelectorAll(gameSel)[index];
+    if (!game) return null;
+    const teams = game.querySelectorAll(teamSel);
+    const odds = Array.from(game.querySelectorAll(oddsSel + ' button'))
+        .filter(b => !b.disabled)
+        .map(b => b.innerText);
+    return [teams[0]?.innerText, teams[1]?.innerText, ...odds];
+}
+"""
+
+
+class BrowserPool:
+    """
+    Lazily launched pool of browsers that hands out reusable contexts
+    Contexts are recycled on release instead of relaunching Chromium,
+    and replaced after MAX_CONTEXT_USES acquisitions to avoid leaks
+    """
+    
+    POOL_MAX = 4
+    CONTEXTS_PER_BROWSER = 8
+    MAX_CONTEXT_USES = 100
+    
+    def __init__(self, playwright, headless: bool = config.HEADLESS):
+        self.playwright = playwright
+        self.headless = headless
+        self.logger = AgentLogger("BrowserPool")
+        
+        self._browsers: List[Browser] = []
+        self._idle: List[BrowserContext] = []
+        self._owners: Dict[BrowserContext, Browser] = {}  # {context: browser}
+        self._uses: Dict[BrowserContext, int] = {}
+        self._reserved: Dict[Browser, int] = {}  # {browser: contexts being created}
+        self._launching = 0  # Browsers being launched
+        self._available = asyncio.Condition()
+    
+    async def acquire(self) -> BrowserContext:
+        """Get an idle context, creating browsers/contexts up to the pool caps"""
+        async with self._available:
+            while True:
+                if self._idle:
+                    context = self._idle.pop()
+                    self._uses[context] += 1
+                    return context
+                
+                # Reserve a slot, then launch/create outside the lock so a slow
+                # browser launch does not block every other acquire/release
+                browser = self._browser_with_capacity()
+                if browser is not None:
+                    self._reserved[browser] = self._reserved.get(browser, 0) + 1
+                    break
+                if len(self._browsers) + self._launching < self.POOL_MAX:
+                    self._launching += 1
+                    break
+                
+                # Pool exhausted - wait for a release
+                await self._available.wait()
+        
+        launched = browser is None
+        context = None
+        try:
+            if launched:
+                browser = await self.playwright.chromium.launch(headless=self.headless)
+            context = await browser.new_context(
+                viewport={'width': 1920, 'height': 1080}
+            )
+        finally:
+            async with self._available:
+                if launched:
+                    self._launching -= 1
+                    if browser is not None:
+                        self._browsers.append(browser)
+                        self.logger.info("Launched pooled browser", pool_size=len(self._browsers))
+                else:
+                    self._reserved[browser] -= 1
+                
+                if context is not None:
+                    self._owners[context] = browser
+                    self._uses[context] = 1
+                
+                # Capacity changed (new browser, or a failed reservation was undone)
+                self._available.notify_all()
+        
+        return context
+    
+    async def release(self, context: BrowserContext):
+        """Return a context to the pool, recycling it once it is worn out"""
+        async with self._available:
+            if self._uses.get(context, 0) >= self.MAX_CONTEXT_USES:
+                self._owners.pop(context, None)
+                self._uses.pop(context, None)
+                await context.close()
+                self.logger.debug("Recycled worn-out context")
+            else:
+                # Drop pages left open by the caller so the context starts clean
+                for page in context.pages:
+                    await page.close()
+                self._idle.append(context)
+            
+            self._available.notify()
+    
+    def _browser_with_capacity(self) -> Optional[Browser]:
+        """Return a launched browser that can take another context, if any"""
+        for browser in self._browsers:
+            in_use = sum(1 for owner in self._owners.values() if owner is browser)
+            if in_use + self._reserved.get(browser, 0) < self.CONTEXTS_PER_BROWSER:
+                return browser
+        
+        return None
+    
+    async def close(self):
+        """Close every pooled browser"""
+        for browser in self._browsers:
+            await browser.close()
+        
+        self._browsers.clear()
+        self._idle.clear()
+        self._owners.clear()
+        self._uses.clear()
+        self._reserved.clear()
+
 
 class MatchdayAgent:
     """
@@ -20,6 +178,35 @@ class MatchdayAgent:
     Enhanced with retry logic, validation, and monitoring
     """
     
+    # One agent per match can mean hundreds alive at once - no per-instance __dict__
+    __slots__ = (
+        'agent_name', 'logger', 'state',
+        'page', 'data_agent', 'league', 'match_index', 'match_id',
+        'running', 'scrape_interval', 'metrics',
+        '_not_scraping', '_error_backoff',
+        '_save_buffer', '_save_last_flush', '_save_batch_size', '_save_flush_interval',
+        '_dedup_cache_file', '_last_data_hash', '_consecutive_duplicates', '_last_header_hash',
+        '_frac_cache', '_frac_cache_size',
+    )
+    
+    # Market type mapping (shared by every agent)
+    market_type_map = {
+        'm3': '1X2',
+        'm2': 'GG/NG',  # Both Teams to Score
+        'm4': 'Over/Under',
+        'm5': 'Handicap',
+        'm6': 'Double Chance',
+        'm7': 'Draw No Bet',
+        'm8': 'Half Time/Full Time',
+        'm9': 'Correct Score',
+        'm10': 'Asian Handicap',
+    }
+    
+    # Any market pattern in a class attribute, longest first so 'm10' wins over shorter keys
+    _MARKET_RE = re.compile('|'.join(
+        re.escape(pattern) for pattern in sorted(market_type_map, key=len, reverse=True)
+    ))
+    
     def __init__(
         self, 
         page: Page, 
@@ -39,45 +226,78 @@ class MatchdayAgent:
         self.match_id = match_id
         
         self.running = False
-        self._scraping_in_progress = False
+        self._not_scraping = asyncio.Event()  # Set while no scrape is in flight
+        self._not_scraping.set()
         self.scrape_interval = 5.0  # Scrape every 5 seconds
+        self._error_backoff = 1.0  # Grows exponentially while the loop keeps failing
         
-        # Caching and duplicate detection
-        self._last_data_hash = None
+        # Buffered saves, flushed every few scrapes or once a minute
+        # (must stay well above the slowest scrape interval, 30s, or every
+        # snapshot would be flushed on its own)
+        self._save_buffer: List[Dict] = []
+        self._save_last_flush = time.monotonic()
+        self._save_batch_size = 8
+        self._save_flush_interval = 60.0
+        
+        # Caching and duplicate detection (primed from the last run, if any)
+        self._dedup_cache_file = data_agent.data_dir / "dedup_cache" / f"{match_id}.json"
+        self._last_data_hash = self._load_dedup_cache()
         self._consecutive_duplicates = 0
+        self._last_header_hash = None
         
         # Monitoring metrics
-        self.metrics = {
-            'scrapes_completed': 0,
-            'scrapes_failed': 0,
-            'scrapes_skipped': 0,
-            'last_scrape_time': None,
-            'data_points_collected': 0,
-            'last_successful_scrape': None,
-            'total_runtime': 0.0
-        }
+        self.metrics = MatchdayMetrics()
         
-        # Market type mapping
-        self.market_type_map = {
-            'm3': '1X2',
-            'm2': 'GG/NG',  # Both Teams to Score
-            'm4': 'Over/Under',
-            'm5': 'Handicap',
-            'm6': 'Double Chance',
-            'm7': 'Draw No Bet',
-            'm8': 'Half Time/Full Time',
-            'm9': 'Correct Score',
-            'm10': 'Asian Handicap',
-        }
+        # Parsed fractional odds ("5/2" -> 3.5), bounded LRU
+        self._frac_cache: OrderedDict = OrderedDict()
+        self._frac_cache_size = 128
         
         self.logger.info("MatchdayAgent initialized", 
                         match_id=match_id, 
                         match_index=match_index,
                         league=league)
     
+    @classmethod
+    async def create_batch(
+        cls,
+        pool: BrowserPool,
+        data_agent: DataAgent,
+        matches: List[Dict]
+    ) -> List['MatchdayAgent']:
+        """
+        Create one agent per match on contexts from a shared browser pool
+        Each agent gets its own context + page, while the pool keeps the
+        number of Chromium processes bounded no matter how many matches
+        are tracked
+        
+        Args:
+            pool: Browser pool (callers own its lifecycle)
+            data_agent: Shared data agent
+            matches: List of dicts with 'league', 'match_index' and 'match_id'
+            
+        Returns:
+            List of initialized (not started) agents
+        """
+        agents = []
+        
+        for match in matches:
+            context = await pool.acquire()
+            page = await context.new_page()
+            page.set_default_timeout(config.BROWSER_TIMEOUT)
+            
+            agents.append(cls(
+                page=page,
+                data_agent=data_agent,
+                league=match['league'],
+                match_index=match['match_index'],
+                match_id=match['match_id']
+            ))
+        
+        return agents
+    
     async def start(self):
         """Start scraping matchday data"""
-        self.logger.state_change(self.state.value, AgentState.RUNNING.value)
+        self.logger.state_change(self.state, AgentState.RUNNING)
         self.state = AgentState.RUNNING
         self.running = True
         start_time = datetime.now()
@@ -89,24 +309,38 @@ class MatchdayAgent:
     
     async def _scrape_loop(self):
         """Main scraping loop with timer checks and adaptive intervals"""
-        loop_start = datetime.now()
+        loop_start = time.monotonic()
         
         while self.running:
-            iteration_start = datetime.now()
+            iteration_start = time.monotonic()
             
             try:
                 # Check if we should be active based on timer
-                should_scrape = await self._should_scrape()
+                should_scrape, timer_value = await self._should_scrape()
                 
                 if not should_scrape:
-                    self.metrics['scrapes_skipped'] += 1
+                    self.metrics.scrapes_skipped += 1
                     self.logger.debug("Timer condition not met, skipping scrape")
                     await asyncio.sleep(1)
                     continue
                 
+                # Steady state: only do the full scrape once the header changes
+                if self._consecutive_duplicates >= 3:
+                    header_hash = await self._scrape_header_only()
+                    
+                    if header_hash is not None and header_hash == self._last_header_hash:
+                        self.metrics.scrapes_skipped += 1
+                        self.logger.debug("Header unchanged, skipping full scrape")
+                        await asyncio.sleep(self.scrape_interval)
+                        continue
+                    
+                    if self._last_header_hash is not None:
+                        self._consecutive_duplicates = 0
+                    self._last_header_hash = header_hash
+                
                 # Scrape match data with retry logic
                 matchday_data = await self._scrape_with_retry(
-                    self._scrape_matchday_data,
+                    lambda: self._scrape_matchday_data(timer_value),
                     max_retries=2,
                     delay=1
                 )
@@ -118,23 +352,25 @@ class MatchdayAgent:
                         await asyncio.sleep(self.scrape_interval)
                         continue
                     
-                    # Save to data agent
-                    await self.data_agent.save_matchday_data(
-                        self.match_id,
-                        matchday_data.to_dict()
-                    )
+                    # Buffer for the data agent, flushing in batches
+                    self._save_buffer.append(matchday_data.to_dict())
+                    if (len(self._save_buffer) >= self._save_batch_size or
+                            time.monotonic() - self._save_last_flush > self._save_flush_interval):
+                        await self._flush_saves()
                     
-                    self.metrics['scrapes_completed'] += 1
-                    self.metrics['last_scrape_time'] = datetime.now()
-                    self.metrics['last_successful_scrape'] = datetime.now()
-                    self.metrics['data_points_collected'] += len(matchday_data.markets)
+                    self.metrics.scrapes_completed += 1
+                    self._error_backoff = 1.0
+                    scraped_at = datetime.now()
+                    self.metrics.last_scrape_time = scraped_at
+                    self.metrics.last_successful_scrape = scraped_at
+                    self.metrics.data_points_collected += len(matchday_data.markets)
                     
                     self.logger.data_collected("matchday_data",
                                               markets=len(matchday_data.markets),
                                               interval=self.scrape_interval)
                 
                 # Calculate adaptive sleep based on scrape duration
-                iteration_duration = (datetime.now() - iteration_start).total_seconds()
+                iteration_duration = time.monotonic() - iteration_start
                 sleep_time = max(0.1, self.scrape_interval - iteration_duration)
                 await asyncio.sleep(sleep_time)
                 
@@ -142,23 +378,44 @@ class MatchdayAgent:
                 self.logger.info("Scrape loop cancelled")
                 break
             except Exception as e:
-                self.metrics['scrapes_failed'] += 1
+                self.metrics.scrapes_failed += 1
                 self.logger.error(f"Error in scrape loop: {e}", exc_info=True)
-                await asyncio.sleep(1)  # Brief pause on error
+                
+                # Jittered exponential backoff, bounded by the scrape interval
+                await asyncio.sleep(self._error_backoff + random.random() * 0.25)
+                self._error_backoff = min(self._error_backoff * 2, self.scrape_interval * 8)
         
         # Update total runtime
-        self.metrics['total_runtime'] = (datetime.now() - loop_start).total_seconds()
+        self.metrics.total_runtime = time.monotonic() - loop_start
+    
+    async def _flush_saves(self):
+        """Write all buffered matchday snapshots to the data agent in one batch"""
+        self._save_last_flush = time.monotonic()
+        if not self._save_buffer:
+            return
+        
+        batch, self._save_buffer = self._save_buffer, []
+        if not await self.data_agent.save_matchday_data_batch(self.match_id, batch):
+            # Keep the snapshots for the next flush instead of dropping them
+            self._save_buffer = batch + self._save_buffer
+            self.logger.warning("Matchday batch save failed, will retry", size=len(batch))
     
-    async def _should_scrape(self) -> bool:
-        """Check if agent should scrape based on timer conditions"""
+    async def _should_scrape(self) -> Tuple[bool, Optional[str]]:
+        """
+        Check if agent should scrape based on timer conditions
+        
+        Returns:
+            (should_scrape, timer_value) - the timer value is reused by the scrape
+        """
+        timer_value = None
         try:
             timer_value = await self._get_timer_value()
             if not timer_value or timer_value.lower() == 'unknown':
-                return True  # Default to active if timer not found
+                return True, timer_value  # Default to active if timer not found
             
             # Parse timer value (e.g., "45:23", "1:23:45", or "FT")
             if timer_value.upper() == 'FT':
-                return False  # Match finished
+                return False, timer_value  # Match finished
             
             if ':' in timer_value:
                 parts = timer_value.split(':')
@@ -170,14 +427,14 @@ class MatchdayAgent:
                     hours, minutes, seconds = map(int, parts)
                     total_seconds = hours * 3600 + minutes * 60 + seconds
                 else:
-                    return True  # Unknown format, continue scraping
+                    return True, timer_value  # Unknown format, continue scraping
                 
                 # Active when > 10 seconds, stop when <= 10 seconds
                 # Also handle pre-match (timer might be negative or large)
                 if total_seconds <= 10:
                     self.logger.info("Timer <= 10 seconds, stopping scrape")
                     await self.stop()
-                    return False
+                    return False, timer_value
                 
                 # Adaptive interval based on time to match start
                 if total_seconds > 300:  # More than 5 minutes
@@ -187,45 +444,54 @@ class MatchdayAgent:
                 else:  # Less than 1 minute
                     self.scrape_interval = 2.0
                 
-                return True
+                return True, timer_value
             
-            return True  # Unknown format, continue scraping
+            return True, timer_value  # Unknown format, continue scraping
             
         except (ValueError, IndexError) as e:
             self.logger.warning(f"Error parsing timer '{timer_value}': {e}")
-            return True
+            return True, timer_value
         except Exception as e:
             self.logger.error(f"Error in _should_scrape: {e}")
-            return True
+            return True, timer_value
     
     async def _scrape_with_retry(self, func: Callable, max_retries: int = 3, delay: float = 1.0):
         """Execute a scrape function with retry logic"""
         last_exception = None
         
-        for attempt in range(max_retries):
-            try:
-                self._scraping_in_progress = True
-                result = await func()
-                self._scraping_in_progress = False
-                return result
-                
-            except Exception as e:
-                last_exception = e
-                self._scraping_in_progress = False
-                
-                if attempt == max_retries - 1:
-                    break
-                
-                self.logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {e}")
-                await asyncio.sleep(delay * (attempt + 1))  # Exponential backoff
+        # Nested calls (e.g. from _extract_teams) must not signal completion early
+        owns_event = self._not_scraping.is_set()
+        self._not_scraping.clear()
+        
+        try:
+            for attempt in range(max_retries):
+                try:
+                    return await func()
+                    
+                except Exception as e:
+                    last_exception = e
+                    
+                    if attempt == max_retries - 1:
+                        break
+                    
+                    self.logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {e}")
+                    await asyncio.sleep(delay * (attempt + 1))  # Exponential backoff
+        finally:
+            if owns_event:
+                self._not_scraping.set()
         
         if last_exception:
             self.logger.error(f"All {max_retries} attempts failed: {last_exception}")
         
         return None
     
-    async def _scrape_matchday_data(self) -> Optional[MatchdayData]:
-        """Scrape complete matchday data with validation"""
+    async def _scrape_matchday_data(self, timer_value: Optional[str] = None) -> Optional[MatchdayData]:
+        """
+        Scrape complete matchday data with validation
+        
+        Args:
+            timer_value: Timer already read by _should_scrape this iteration
+        """
         try:
             # Get all game containers
             game_containers = await self.page.query_selector_all(selectors.GAME_CONTAINER)
@@ -239,8 +505,14 @@ class MatchdayAgent:
             
             game_elem = game_containers[self.match_index]
             
+            # Rolling fingerprint for duplicate detection, fed as fields are finalized
+            fingerprint = Fingerprint()
+            
+            # One timestamp for every object built in this scrape pass
+            timestamp = datetime.now().isoformat()
+            
             # Extract team information
-            teams = await self._extract_teams(game_elem)
+            teams = await self._extract_teams(game_elem, fingerprint)
             if not teams:
                 self.logger.warning("Failed to extract team information")
                 return None
@@ -253,10 +525,10 @@ class MatchdayAgent:
                 return None
             
             # Extract odds
-            markets = await self._extract_odds(game_elem)
+            markets = await self._extract_odds(game_elem, fingerprint, timestamp)
             
-            # Get current timer value
-            timer_value = await self._get_timer_value()
+            # Timer was read in _should_scrape this iteration
+            fingerprint.update(f"{timer_value or 'unknown'}".encode())
             
             # Create matchday data object
             matchday_data = MatchdayData(
@@ -266,8 +538,9 @@ class MatchdayAgent:
                 away_team=away_team,
                 timer=timer_value or "unknown",
                 markets=markets,
-                scrape_timestamp=datetime.now()
+                timestamp=timestamp
             )
+            matchday_data._fp = fingerprint.intdigest()
             
             self.logger.debug(
                 f"Scraped matchday data",
@@ -283,7 +556,25 @@ class MatchdayAgent:
             self.logger.error(f"Error scraping matchday data: {e}", exc_info=True)
             return None
     
-    async def _extract_teams(self, game_elem) -> Optional[Tuple[TeamInfo, TeamInfo]]:
+    async def _scrape_header_only(self) -> Optional[int]:
+        """Hash just the team names and odds of this match in one evaluate call"""
+        try:
+            header = await self.page.evaluate(HEADER_JS, [
+                self.match_index,
+                selectors.GAME_CONTAINER,
+                selectors.TEAM_NAMES,
+                selectors.ODDS_CONTAINER
+            ])
+            if not header:
+                return None
+            
+            return Fingerprint("|".join(part or "" for part in header).encode()).intdigest()
+            
+        except Exception as e:
+            self.logger.debug(f"Error scraping header: {e}")
+            return None
+    
+    async def _extract_teams(self, game_elem, fingerprint=None) -> Optional[Tuple[TeamInfo, TeamInfo]]:
         """Extract team information from game element with validation"""
         try:
             # Get team names with retry
@@ -304,6 +595,9 @@ class MatchdayAgent:
             home_name = home_name.strip()
             away_name = away_name.strip()
             
+            if fingerprint is not None:
+                fingerprint.update(f"{home_name}{away_name}".encode())
+            
             # Get team logos
             logo_elems = await game_elem.query_selector_all(selectors.TEAM_LOGOS)
             home_logo = None
@@ -313,16 +607,8 @@ class MatchdayAgent:
                 home_logo = await logo_elems[0].get_attribute('src')
                 away_logo = await logo_elems[1].get_attribute('src')
             
-            home_team = TeamInfo(
-                name=home_name,
-                logo_url=home_logo,
-                extracted_at=datetime.now()
-            )
-            away_team = TeamInfo(
-                name=away_name,
-                logo_url=away_logo,
-                extracted_at=datetime.now()
-            )
+            home_team = TeamInfo(name=home_name, logo_url=home_logo)
+            away_team = TeamInfo(name=away_name, logo_url=away_logo)
             
             return (home_team, away_team)
             
@@ -330,9 +616,24 @@ class MatchdayAgent:
             self.logger.error(f"Error extracting teams: {e}")
             return None
     
-    async def _extract_odds(self, game_elem) -> List[OddsData]:
-        """Extract odds from game element with comprehensive market detection"""
+    async def _extract_odds(
+        self,
+        game_elem,
+        fingerprint=None,
+        timestamp: Optional[str] = None
+    ) -> List[OddsData]:
+        """
+        Extract odds from game element with comprehensive market detection
+        If a fingerprint hasher is given, each parsed option is fed into it;
+        every option and market shares the scrape pass timestamp
+        """
         markets = []
+        timestamp = timestamp or datetime.now().isoformat()
+        
+        # Bind hot-loop lookups once per call
+        parse_fraction = self._parse_fractional_odds
+        determine_market_type = self._determine_market_type
+        update_fingerprint = fingerprint.update if fingerprint is not None else None
         
         try:
             # Get odds container
@@ -347,58 +648,44 @@ class MatchdayAgent:
             for section in odds_sections:
                 try:
                     # Determine market type
-                    market_type = await self._determine_market_type(section)
+                    market_type = await determine_market_type(section)
                     
-                    # Extract odds buttons
-                    buttons = await section.query_selector_all('button')
+                    # Extract enabled buttons' label/value pairs in one JS round-trip
+                    pairs = await section.evaluate(ODDS_PAIRS_JS)
                     options = {}
                     
-                    for button in buttons:
+                    for label, value_str in pairs:
+                        if not label or not value_str:
+                            continue
+                        
+                        # Clean and parse value
+                        value_str = value_str.strip()
+                        
                         try:
-                            # Skip disabled buttons
-                            disabled = await button.get_attribute('disabled')
-                            if disabled:
+                            value = float(value_str)
+                        except ValueError:
+                            # Try to handle fractional odds (e.g., "5/2")
+                            value = parse_fraction(value_str)
+                            if value is None:
                                 continue
-                            
-                            # Get option label and value
-                            label_elem = await button.query_selector('small.o-1')
-                            value_elem = await button.query_selector('span.o-2')
-                            
-                            if label_elem and value_elem:
-                                label = await label_elem.inner_text()
-                                value_str = await value_elem.inner_text()
-                                
-                                # Clean and parse value
-                                value_str = value_str.strip()
-                                
-                                try:
-                                    value = float(value_str)
-                                    options[label.strip()] = {
-                                        'odds': value,
-                                        'timestamp': datetime.now()
-                                    }
-                                except ValueError:
-                                    # Try to handle fractional odds (e.g., "5/2")
-                                    if '/' in value_str:
-                                        try:
-                                            num, den = map(float, value_str.split('/'))
-                                            value = num / den + 1
-                                            options[label.strip()] = {
-                                                'odds': value,
-                                                'timestamp': datetime.now()
-                                            }
-                                        except (ValueError, ZeroDivisionError):
-                                            continue
-                    
-                        except Exception as e:
-                            self.logger.debug(f"Error extracting button: {e}")
-                            continue
+                        
+                        label = label.strip()
+                        options[label] = {
+                            'odds': value,
+                            'timestamp': timestamp
+                        }
+                        
+                        if update_fingerprint is not None:
+                            update_fingerprint(f"{label}{value}".encode())
                     
                     if options:
+                        if update_fingerprint is not None:
+                            update_fingerprint(market_type.encode())
+                        
                         market_data = OddsData(
                             market_type=market_type,
                             options=options,
-                            extracted_at=datetime.now()
+                            timestamp=timestamp
                         )
                         markets.append(market_data)
                 
@@ -413,15 +700,37 @@ class MatchdayAgent:
         
         return markets
     
+    def _parse_fractional_odds(self, value_str: str) -> Optional[float]:
+        """Convert fractional odds to decimal, memoizing the few formats the feed uses"""
+        cached = self._frac_cache.get(value_str)
+        if cached is not None:
+            self._frac_cache.move_to_end(value_str)
+            return cached
+        
+        if '/' not in value_str:
+            return None
+        
+        try:
+            num, den = value_str.split('/')
+            value = float(num) / float(den) + 1
+        except (ValueError, ZeroDivisionError):
+            return None
+        
+        self._frac_cache[value_str] = value
+        if len(self._frac_cache) > self._frac_cache_size:
+            self._frac_cache.popitem(last=False)
+        
+        return value
+    
     async def _determine_market_type(self, section) -> str:
         """Determine market type from section element"""
         try:
             # Try class attribute first
             class_attr = await section.get_attribute('class')
             if class_attr:
-                for pattern, market_name in self.market_type_map.items():
-                    if pattern in class_attr:
-                        return market_name
+                match = self._MARKET_RE.search(class_attr)
+                if match:
+                    return self.market_type_map[match.group()]
             
             # Try data attributes
             data_market = await section.get_attribute('data-market')
@@ -445,9 +754,9 @@ class MatchdayAgent:
         if not class_attr:
             return "Unknown"
         
-        for pattern, market in self.market_type_map.items():
-            if pattern in class_attr:
-                return market
+        match = self._MARKET_RE.search(class_attr)
+        if match:
+            return self.market_type_map[match.group()]
         
         return "Unknown"
     
@@ -475,19 +784,8 @@ class MatchdayAgent:
     def _is_duplicate_data(self, matchday_data: MatchdayData) -> bool:
         """Check if data is duplicate of previous scrape"""
         try:
-            # Create hash of key data fields
-            data_str = (
-                f"{matchday_data.home_team.name}"
-                f"{matchday_data.away_team.name}"
-                f"{matchday_data.timer}"
-            )
-            
-            for market in matchday_data.markets:
-                data_str += f"{market.market_type}"
-                for label, odds_data in market.options.items():
-                    data_str += f"{label}{odds_data['odds']}"
-            
-            data_hash = hashlib.md5(data_str.encode()).hexdigest()
+            # Fingerprint is rolled up during extraction in _scrape_matchday_data
+            data_hash = matchday_data._fp
             
             if data_hash == self._last_data_hash:
                 self._consecutive_duplicates += 1
@@ -504,6 +802,7 @@ class MatchdayAgent:
             else:
                 self._last_data_hash = data_hash
                 self._consecutive_duplicates = 0
+                self._last_header_hash = None  # Re-baseline once duplicates resume
                 self.scrape_interval = 5.0  # Reset to default
                 return False
                 
@@ -511,6 +810,35 @@ class MatchdayAgent:
             self.logger.error(f"Error in duplicate detection: {e}")
             return False
     
+    def _load_dedup_cache(self) -> Optional[int]:
+        """Load the last seen data hash persisted by a previous run of this match"""
+        try:
+            if self._dedup_cache_file.exists():
+                with open(self._dedup_cache_file, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                last_data_hash = cached.get('last_data_hash')
+                # Caches from before int fingerprints hold hex strings - ignore those
+                if cached.get('match_id') == self.match_id and isinstance(last_data_hash, int):
+                    return last_data_hash
+        except Exception as e:
+            self.logger.debug(f"Could not load dedup cache: {e}")
+        return None
+    
+    def _save_dedup_cache(self):
+        """Persist the last seen data hash so a restarted agent skips known data"""
+        if self._last_data_hash is None:
+            return
+        
+        try:
+            self._dedup_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._dedup_cache_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'match_id': self.match_id,
+                    'last_data_hash': self._last_data_hash
+                }, f)
+        except Exception as e:
+            self.logger.warning(f"Could not save dedup cache: {e}")
+    
     async def scrape_all_markets(self) -> List[OddsData]:
         """
         Scrape all available markets by clicking through filters
@@ -544,8 +872,7 @@ class MatchdayAgent:
                         markets = await self._extract_odds(game_elem)
                         
                         # Update market type with actual name
-                        for market in markets:
-                            market.market_type = market_name
+                        markets = [replace(m, market_type=market_name) for m in markets]
                         
                         all_markets.extend(markets)
                     
@@ -572,20 +899,17 @@ class MatchdayAgent:
     
     async def _wait_for_loop_completion(self, timeout: float = 10.0):
         """Wait for current scrape iteration to complete"""
-        start_time = datetime.now()
-        
-        while self._scraping_in_progress:
-            if (datetime.now() - start_time).total_seconds() > timeout:
-                self.logger.warning("Timeout waiting for scrape to complete")
-                break
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(self._not_scraping.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("Timeout waiting for scrape to complete")
     
     async def stop(self):
         """Stop matchday scraping with graceful shutdown"""
         if self.state == AgentState.STOPPED:
             return
         
-        self.logger.state_change(self.state.value, AgentState.STOPPING.value)
+        self.logger.state_change(self.state, AgentState.STOPPING)
         self.state = AgentState.STOPPING
         self.running = False
         
@@ -600,43 +924,56 @@ class MatchdayAgent:
         except Exception as e:
             self.logger.error(f"Error during shutdown: {e}")
         
+        try:
+            await self._flush_saves()
+        except Exception as e:
+            self.logger.error(f"Error flushing buffered saves: {e}")
+        
+        self._save_dedup_cache()
+        
         self.state = AgentState.STOPPED
-        self.logger.state_change(AgentState.STOPPING.value, self.state.value)
+        self.logger.state_change(AgentState.STOPPING, self.state)
         
         # Log final metrics
         self.logger.info(
             "MatchdayAgent stopped",
             metrics=self.metrics,
-            total_runtime=f"{self.metrics['total_runtime']:.2f}s"
+            total_runtime=f"{self.metrics.total_runtime:.2f}s"
         )
     
+    async def shutdown_context(self, pool: BrowserPool):
+        """Return this agent's browser context to the pool, leaving the browsers running"""
+        try:
+            await pool.release(self.page.context)
+            self.logger.info("Browser context released")
+        except Exception as e:
+            self.logger.error(f"Error releasing browser context: {e}")
+    
     def get_metrics(self) -> Dict:
         """Return current metrics"""
-        metrics = self.metrics.copy()
-        metrics.update({
-            'state': self.state.value,
+        return self.metrics.to_dict() | {
+            'state': self.state,
             'running': self.running,
             'scrape_interval': self.scrape_interval,
             'consecutive_duplicates': self._consecutive_duplicates,
             'match_id': self.match_id,
             'league': self.league
-        })
-        return metrics
+        }
     
     def get_status(self) -> Dict:
         """Return agent status summary"""
         return {
             'agent_name': self.agent_name,
-            'state': self.state.value,
+            'state': self.state,
             'match_id': self.match_id,
             'league': self.league,
             'match_index': self.match_index,
             'running': self.running,
             'scrape_interval': self.scrape_interval,
-            'last_scrape': self.metrics['last_scrape_time'].isoformat() 
-                         if self.metrics['last_scrape_time'] else None,
-            'scrapes_completed': self.metrics['scrapes_completed'],
-            'scrapes_failed': self.metrics['scrapes_failed']
+            'last_scrape': self.metrics.last_scrape_time.isoformat() 
+                         if self.metrics.last_scrape_time else None,
+            'scrapes_completed': self.metrics.scrapes_completed,
+            'scrapes_failed': self.metrics.scrapes_failed
         }
 
 
@@ -647,20 +984,20 @@ async def main():
     import asyncio
     
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
+        # Warm pool shared by every agent; contexts are recycled, not relaunched
+        pool = BrowserPool(p, headless=False)
         
         data_agent = DataAgent(data_dir="test_data")
         await data_agent.initialize()
         
         # Test parameters
-        agent = MatchdayAgent(
-            page=page,
-            data_agent=data_agent,
-            league="english",
-            match_index=0,
-            match_id="test_match_001"
-        )
+        agents = await MatchdayAgent.create_batch(pool, data_agent, [{
+            'league': "english",
+            'match_index': 0,
+            'match_id': "test_match_001"
+        }])
+        agent = agents[0]
+        page = agent.page
         
         print(f"Navigating to {config.TARGET_URL}...")
         try:
@@ -680,7 +1017,8 @@ async def main():
             print(f"Error: {e}")
         finally:
             await data_agent.shutdown()
-            await browser.close()
+            await agent.shutdown_context(pool)
+            await pool.close()
 
 if __name__ == "__main__":
     import asyncio
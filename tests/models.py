@@ -1,12 +1,12 @@
 """
 Data models for the OdiLeague scraper
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 
-class MatchState(Enum):
+class MatchState(StrEnum):
     """Match lifecycle states"""
     IDLE = "idle"
     PENDING = "pending"
@@ -17,7 +17,7 @@ class MatchState(Enum):
     VALIDATED = "validated"
     ARCHIVED = "archived"
 
-class AgentState(Enum):
+class AgentState(StrEnum):
     """Agent lifecycle states"""
     INITIALIZING = "initializing"
     RUNNING = "running"
@@ -26,16 +26,16 @@ class AgentState(Enum):
     STOPPED = "stopped"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamInfo:
     """Team information"""
     name: str
     logo_url: Optional[str] = None
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {'name': self.name, 'logo_url': self.logo_url}
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OddsData:
     """Betting odds for a market"""
     market_type: str  # e.g., "1X2", "GG/NG"
@@ -43,9 +43,13 @@ class OddsData:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'market_type': self.market_type,
+            'options': dict(self.options),
+            'timestamp': self.timestamp
+        }
 
-@dataclass
+@dataclass(slots=True)
 class MatchdayData:
     """Pre-match data"""
     match_id: str
@@ -55,15 +59,20 @@ class MatchdayData:
     timer: str
     markets: List[OddsData] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    _fp: Optional[int] = field(default=None, init=False, repr=False, compare=False)  # Dedup fingerprint
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['home_team'] = self.home_team.to_dict()
-        data['away_team'] = self.away_team.to_dict()
-        data['markets'] = [m.to_dict() for m in self.markets]
-        return data
+        return {
+            'match_id': self.match_id,
+            'league': self.league,
+            'home_team': self.home_team.to_dict(),
+            'away_team': self.away_team.to_dict(),
+            'timer': self.timer,
+            'markets': [m.to_dict() for m in self.markets],
+            'timestamp': self.timestamp
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalEvent:
     """Goal event information"""
     team: str  # "home" or "away"
@@ -71,9 +80,9 @@ class GoalEvent:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {'team': self.team, 'minute': self.minute, 'timestamp': self.timestamp}
 
-@dataclass
+@dataclass(slots=True)
 class LiveMatchData:
     """Live match data"""
     match_id: str
@@ -88,11 +97,20 @@ class LiveMatchData:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['goals'] = [g.to_dict() for g in self.goals]
-        return data
+        return {
+            'match_id': self.match_id,
+            'league': self.league,
+            'home_team': self.home_team,
+            'away_team': self.away_team,
+            'home_score': self.home_score,
+            'away_score': self.away_score,
+            'halftime_score': self.halftime_score,
+            'goals': [g.to_dict() for g in self.goals],
+            'match_phase': self.match_phase,
+            'timestamp': self.timestamp
+        }
 
-@dataclass
+@dataclass(slots=True)
 class ResultData:
     """Final match result"""
     match_id: str
@@ -107,20 +125,36 @@ class ResultData:
     validated: bool = False
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'match_id': self.match_id,
+            'league': self.league,
+            'week': self.week,
+            'match_time': self.match_time,
+            'home_team': self.home_team,
+            'away_team': self.away_team,
+            'home_score': self.home_score,
+            'away_score': self.away_score,
+            'timestamp': self.timestamp,
+            'validated': self.validated
+        }
 
-@dataclass
+@dataclass(slots=True)
 class StandingsEntry:
     """Single team standing entry"""
     position: int
     team: str
     points: int
-    form: List[str]  # ["W", "D", "L", "W", "W"]
+    form: str = ""  # "WDLWW" - one packed string instead of a list of letters
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'position': self.position,
+            'team': self.team,
+            'points': self.points,
+            'form': self.form
+        }
 
-@dataclass
+@dataclass(slots=True)
 class StandingsData:
     """League standings"""
     league: str
@@ -129,11 +163,36 @@ class StandingsData:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['entries'] = [e.to_dict() for e in self.entries]
-        return data
+        return {
+            'league': self.league,
+            'season': self.season,
+            'entries': [e.to_dict() for e in self.entries],
+            'timestamp': self.timestamp
+        }
 
-@dataclass
+@dataclass(slots=True)
+class MatchdayMetrics:
+    """Per-agent scrape counters, updated on every loop iteration"""
+    scrapes_completed: int = 0
+    scrapes_failed: int = 0
+    scrapes_skipped: int = 0
+    last_scrape_time: Optional[datetime] = None
+    data_points_collected: int = 0
+    last_successful_scrape: Optional[datetime] = None
+    total_runtime: float = 0.0
+    
+    def to_dict(self) -> dict:
+        return {
+            'scrapes_completed': self.scrapes_completed,
+            'scrapes_failed': self.scrapes_failed,
+            'scrapes_skipped': self.scrapes_skipped,
+            'last_scrape_time': self.last_scrape_time,
+            'data_points_collected': self.data_points_collected,
+            'last_successful_scrape': self.last_successful_scrape,
+            'total_runtime': self.total_runtime
+        }
+
+@dataclass(slots=True)
 class AgentMessage:
     """Message for inter-agent communication"""
     sender: str
@@ -143,9 +202,15 @@ class AgentMessage:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'sender': self.sender,
+            'recipient': self.recipient,
+            'message_type': self.message_type,
+            'payload': dict(self.payload),
+            'timestamp': self.timestamp
+        }
 
-@dataclass
+@dataclass(slots=True)
 class TimerEvent:
     """Timer state change event"""
     league: str
@@ -155,4 +220,10 @@ class TimerEvent:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'league': self.league,
+            'timer_value': self.timer_value,
+            'match_index': self.match_index,
+            'event_type': self.event_type,
+            'timestamp': self.timestamp
+        }
@@ -35,6 +35,8 @@ class OrchestratorAgent:
         
         # Control
         self.running = False
+        self._shutdown_evt = asyncio.Event()
+        self._background_tasks: List[asyncio.Task] = []
         
         self.logger.info("=" * 60)
         self.logger.info("OdiLeague Agentic Scraper System")
@@ -42,7 +44,7 @@ class OrchestratorAgent:
     
     async def initialize(self):
         """Initialize the entire system"""
-        self.logger.state_change(self.state.value, AgentState.INITIALIZING.value)
+        self.logger.state_change(self.state, AgentState.INITIALIZING)
         self.state = AgentState.INITIALIZING
         
         try:
@@ -65,7 +67,7 @@ class OrchestratorAgent:
             await self._init_league_agents()
             
             self.state = AgentState.RUNNING
-            self.logger.state_change(AgentState.INITIALIZING.value, self.state.value)
+            self.logger.state_change(AgentState.INITIALIZING, self.state)
             self.logger.info("✓ System initialization complete")
             
         except Exception as e:
@@ -74,23 +76,34 @@ class OrchestratorAgent:
             raise
     
     async def _init_browser(self):
-        """Initialize browser"""
+        """Initialize browser and the timer agent's dedicated page"""
         self.logger.info("Initializing browser...")
         
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=config.HEADLESS,
-            args=['--start-maximized']
-        )
         
+        if config.CDP_ENDPOINT:
+            # Reuse a warm, externally managed Chromium across restarts
+            self.browser = await self.playwright.chromium.connect_over_cdp(config.CDP_ENDPOINT)
+            self.logger.info("Connected to running browser at %s", config.CDP_ENDPOINT)
+        else:
+            self.browser = await self.playwright.chromium.launch(
+                headless=config.HEADLESS,
+                args=['--start-maximized']
+            )
+        
+        self.page = await self._new_page()
+        
+        self.logger.info("✓ Browser initialized")
+    
+    async def _new_page(self) -> Page:
+        """Open a page in its own context on the shared browser"""
         context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080}
         )
         
-        self.page = await context.new_page()
-        self.page.set_default_timeout(config.BROWSER_TIMEOUT)
-        
-        self.logger.info("✓ Browser initialized")
+        page = await context.new_page()
+        page.set_default_timeout(config.BROWSER_TIMEOUT)
+        return page
     
     async def _init_data_agent(self):
         """Initialize data agent"""
@@ -105,24 +118,27 @@ class OrchestratorAgent:
         
         self.logger.info("✓ Data agent initialized")
     
-    async def _navigate_to_target(self):
+    async def _navigate_to_target(self, page: Page = None):
         """Navigate to target URL"""
-        self.logger.info(f"Navigating to {config.TARGET_URL}...")
+        page = page or self.page
+        self.logger.info("Navigating to %s...", config.TARGET_URL)
         
-        await self.page.goto(config.TARGET_URL, wait_until='networkidle')
-        await asyncio.sleep(2)
+        await page.goto(config.TARGET_URL, wait_until='networkidle')
+        await page.wait_for_selector(selectors.LEAGUE_CONTAINER, timeout=config.SETTLE_TIMEOUT)
         
         self.logger.info("✓ Navigation complete")
     
-    async def _handle_popup(self):
+    async def _handle_popup(self, page: Page = None):
         """Handle initial popup"""
+        page = page or self.page
         self.logger.info("Checking for popup...")
         
         try:
-            popup_close = await self.page.query_selector(selectors.POPUP_CLOSE)
+            popup_close = await page.query_selector(selectors.POPUP_CLOSE)
             if popup_close:
                 await popup_close.click()
-                await asyncio.sleep(1)
+                await page.wait_for_selector(selectors.POPUP_CLOSE, state='detached',
+                                             timeout=config.SETTLE_TIMEOUT)
                 self.logger.info("✓ Popup dismissed")
             else:
                 self.logger.info("No popup found")
@@ -142,23 +158,37 @@ class OrchestratorAgent:
         self.logger.info("✓ Timer agent initialized")
     
     async def _init_league_agents(self):
-        """Initialize all league agents"""
-        self.logger.info(f"Initializing {len(config.LEAGUES)} league agents...")
+        """
+        Initialize all league agents
+        Each league gets its own context + page so navigations run in parallel
+        """
+        self.logger.info("Initializing %d league agents...", len(config.LEAGUES))
         
-        for league_config in config.LEAGUES:
+        pages = await asyncio.gather(*(
+            self._open_league_page() for _ in config.LEAGUES
+        ))
+        
+        for league_config, page in zip(config.LEAGUES, pages):
             league_id = league_config['id']
             
-            league_agent = LeagueAgent(
-                page=self.page,
+            self.league_agents[league_id] = LeagueAgent(
+                page=page,
                 data_agent=self.data_agent,
                 league_config=league_config
             )
-            
-            await league_agent.initialize()
-            
-            self.league_agents[league_id] = league_agent
         
-        self.logger.info(f"✓ {len(self.league_agents)} league agents initialized")
+        await asyncio.gather(*(
+            league_agent.initialize() for league_agent in self.league_agents.values()
+        ))
+        
+        self.logger.info("✓ %d league agents initialized", len(self.league_agents))
+    
+    async def _open_league_page(self) -> Page:
+        """Open and prepare an isolated page for one league agent"""
+        page = await self._new_page()
+        await self._navigate_to_target(page)
+        await self._handle_popup(page)
+        return page
     
     async def _handle_timer_event(self, event: TimerEvent):
         """
@@ -179,27 +209,36 @@ class OrchestratorAgent:
         self.logger.info("=" * 60)
         
         self.running = True
+        self._shutdown_evt.clear()
         
-        # Start timer agent
-        timer_task = asyncio.create_task(self.timer_agent.start())
+        # Start timer agent and periodic stats
+        self._background_tasks = [
+            asyncio.create_task(self.timer_agent.start()),
+            asyncio.create_task(self._stats_loop())
+        ]
         
         self.logger.info("✓ System running - monitoring all leagues")
         self.logger.info("Press Ctrl+C to stop")
         
         try:
-            # Keep running until interrupted
-            while self.running:
-                await asyncio.sleep(1)
-                
-                # Periodic stats
-                if int(asyncio.get_event_loop().time()) % 30 == 0:
-                    await self._log_stats()
+            # Keep running until shutdown is requested
+            await self._shutdown_evt.wait()
                     
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             self.logger.info("Keyboard interrupt received")
         finally:
             await self.shutdown()
     
+    async def _stats_loop(self):
+        """Log system statistics every 30 seconds until shutdown"""
+        while not self._shutdown_evt.is_set():
+            await self._log_stats()
+            
+            try:
+                await asyncio.wait_for(self._shutdown_evt.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
+    
     async def _log_stats(self):
         """Log system statistics"""
         try:
@@ -221,35 +260,46 @@ class OrchestratorAgent:
         self.logger.info("SHUTTING DOWN SYSTEM")
         self.logger.info("=" * 60)
         
-        self.logger.state_change(self.state.value, AgentState.STOPPING.value)
+        self.logger.state_change(self.state, AgentState.STOPPING)
         self.state = AgentState.STOPPING
         self.running = False
+        self._shutdown_evt.set()
         
         # Stop timer agent
         if self.timer_agent:
             self.logger.info("Stopping timer agent...")
             await self.timer_agent.stop()
         
+        # Let the timer and stats tasks wind down
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks.clear()
+        
         # Stop all league agents
-        self.logger.info(f"Stopping {len(self.league_agents)} league agents...")
-        for league_agent in self.league_agents.values():
-            await league_agent.shutdown()
+        self.logger.info("Stopping %d league agents...", len(self.league_agents))
+        await asyncio.gather(
+            *(league_agent.shutdown() for league_agent in self.league_agents.values()),
+            return_exceptions=True
+        )
         
         # Shutdown data agent
         if self.data_agent:
             self.logger.info("Shutting down data agent...")
             await self.data_agent.shutdown()
         
-        # Close browser
+        # Close browser - for a CDP connection this only closes our contexts and
+        # disconnects, leaving the remote browser warm for the next run
         if self.browser:
-            self.logger.info("Closing browser...")
+            if config.CDP_ENDPOINT:
+                self.logger.info("Disconnecting from browser...")
+            else:
+                self.logger.info("Closing browser...")
             await self.browser.close()
         
         if self.playwright:
             await self.playwright.stop()
         
         self.state = AgentState.STOPPED
-        self.logger.state_change(AgentState.STOPPING.value, self.state.value)
+        self.logger.state_change(AgentState.STOPPING, self.state)
         
         self.logger.info("=" * 60)
         self.logger.info("✓ SHUTDOWN COMPLETE")
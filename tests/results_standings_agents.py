@@ -1,29 +1,67 @@
 """
 Results Agent - validates and archives final match results
 """
-import asyncio
-from typing import Optional
+import re
+import time
+from typing import Dict, List, Optional, Tuple
 from playwright.async_api import Page
 
-from models import AgentState, ResultData
+from models import AgentState, ResultData, StandingsData, StandingsEntry
 from logger import AgentLogger
-from config import selectors
+from config import config, selectors
 from data_agent import DataAgent
 
+# Week number in a results title, e.g. "English League WEEK 16 - #2026012209"
+_WEEK_RE = re.compile(r"WEEK\s*([^-\s]+)")
+
+# Every results block with its title, time and (teams, scores) per match
+RESULTS_JS = """
+([containerSel, titleSel, timeSel, matchSel, teamSel, scoreSel]) =>
+    Array.from(document.querySelectorAll(containerSel)).map(c => ({
+        title: c.querySelector(titleSel)?.innerText,
+        time: c.querySelector(timeSel)?.innerText,
+        matches: Array.from(c.querySelectorAll(matchSel)).map(m => [
+            Array.from(m.querySelectorAll(teamSel)).map(t => t.innerText.trim()),
+            Array.from(m.querySelectorAll(scoreSel)).map(s => s.innerText.trim())
+        ])
+    }))
+"""
+
+# Standings title plus [position, team, points, form string] per table row
+STANDINGS_JS = """
+([containerSel, titleSel, rowSel]) => {
+    const c = document.querySelector(containerSel);
+    if (!c) return null;
+    return {
+        title: c.querySelector(titleSel)?.innerText,
+        rows: Array.from(c.querySelectorAll(rowSel)).map(r => {
+            const cells = r.querySelectorAll('td');
+            if (cells.length < 4) return null;
+            return [
+                cells[0].innerText.trim(),
+                cells[1].innerText.trim(),
+                cells[2].innerText.trim(),
+                Array.from(cells[3].querySelectorAll('div')).map(d => d.innerText.trim()).join('')
+            ];
+        })
+    };
+}
+"""
+
 class ResultsAgent:
     """
     Scrapes and validates final match results
     Compares live data with results tab data
     """
     
+    # A results index younger than this (seconds) is reused without re-reading the tab
+    RESULTS_INDEX_TTL = 5.0
+    
     def __init__(
         self,
         page: Page,
         data_agent: DataAgent,
-        league: str,
-        match_id: str,
-        home_team: str,
-        away_team: str
+        league: str
     ):
         self.agent_name = f"ResultsAgent-{league}"
         self.logger = AgentLogger(self.agent_name)
@@ -32,35 +70,50 @@ class ResultsAgent:
         self.page = page
         self.data_agent = data_agent
         self.league = league
-        self.match_id = match_id
-        self.home_team = home_team
-        self.away_team = away_team
         
-        self.logger.info("ResultsAgent initialized", match_id=match_id)
+        # Locators are lazy - build once, reuse for every validation
+        self._results_tab = page.locator(selectors.TAB_RESULTS)
+        
+        # (home, away) -> result, shared by every match validated off one tab read
+        self._results_index: Dict[Tuple[str, str], tuple] = {}
+        self._results_index_at = 0.0
+        
+        self.logger.info("ResultsAgent initialized")
     
-    async def validate_and_save(self) -> bool:
+    async def validate_and_save(self, match_id: str, home_team: str, away_team: str) -> bool:
         """
         Validate match result and save
         
+        Args:
+            match_id: Match to validate
+            home_team: Home team name as shown on the matchday card
+            away_team: Away team name as shown on the matchday card
+            
         Returns:
             True if validation successful
         """
-        self.logger.state_change(self.state.value, AgentState.RUNNING.value)
+        self.logger.state_change(self.state, AgentState.RUNNING)
         self.state = AgentState.RUNNING
         
         try:
-            # Navigate to Results tab
-            await self._navigate_to_results()
+            # Matches ending together are answered from the last tab read
+            result_data = None
+            if time.monotonic() - self._results_index_at < self.RESULTS_INDEX_TTL:
+                result_data = self._lookup_result(match_id, home_team, away_team)
             
-            # Find and scrape result
-            result_data = await self._scrape_result()
+            if not result_data:
+                # Navigate to Results tab
+                await self._navigate_to_results()
+                
+                # Find and scrape result
+                result_data = await self._scrape_result(match_id, home_team, away_team)
             
             if not result_data:
                 self.logger.error("Failed to scrape result data")
                 return False
             
             # Get live data for comparison
-            match_data = await self.data_agent.get_match_data(self.match_id)
+            match_data = await self.data_agent.get_match_data(match_id)
             
             if match_data and 'live_data' in match_data:
                 # Validate
@@ -77,10 +130,10 @@ class ResultsAgent:
                 result_data.validated = False
             
             # Save result
-            await self.data_agent.save_result(self.match_id, result_data.to_dict())
+            await self.data_agent.save_result(match_id, result_data)
             
             if result_data.validated:
-                await self.data_agent.mark_validated(self.match_id)
+                await self.data_agent.mark_validated(match_id)
             
             self.state = AgentState.STOPPED
             return True
@@ -93,66 +146,34 @@ class ResultsAgent:
     async def _navigate_to_results(self):
         """Navigate to Results tab"""
         try:
-            results_tab = await self.page.query_selector(selectors.TAB_RESULTS)
-            if results_tab:
-                await results_tab.click()
-                await asyncio.sleep(1)
+            if await self._results_tab.count():
+                await self._results_tab.first.click()
+                await self.page.wait_for_selector(selectors.RESULTS_CONTAINER,
+                                                  timeout=config.SETTLE_TIMEOUT)
                 self.logger.agent_action("Navigated to Results tab")
             
         except Exception as e:
             self.logger.error(f"Error navigating to Results: {e}")
     
-    async def _scrape_result(self) -> Optional[ResultData]:
-        """Scrape result from Results tab"""
+    async def _scrape_result(self, match_id: str, home_team: str, away_team: str) -> Optional[ResultData]:
+        """Scrape result from Results tab (whole tab read in one evaluate call)"""
         try:
-            # Get all result containers
-            result_containers = await self.page.query_selector_all(selectors.RESULTS_CONTAINER)
+            result_blocks = await self.page.evaluate(RESULTS_JS, [
+                selectors.RESULTS_CONTAINER,
+                selectors.RESULTS_TITLE,
+                selectors.RESULTS_TIME,
+                selectors.RESULTS_MATCH,
+                selectors.RESULTS_TEAM,
+                selectors.RESULTS_SCORE
+            ])
             
-            # Search for our match
-            for container in result_containers:
-                # Get match title/info
-                title_elem = await container.query_selector(selectors.RESULTS_TITLE)
-                time_elem = await container.query_selector(selectors.RESULTS_TIME)
-                
-                if title_elem and time_elem:
-                    title_text = await title_elem.inner_text()
-                    time_text = await time_elem.inner_text()
-                    
-                    # Extract week info
-                    week = self._extract_week(title_text)
-                    
-                    # Get all matches in this result block
-                    match_elems = await container.query_selector_all(selectors.RESULTS_MATCH)
-                    
-                    for match_elem in match_elems:
-                        # Extract teams and scores
-                        team_elems = await match_elem.query_selector_all(selectors.RESULTS_TEAM)
-                        score_elems = await match_elem.query_selector_all(selectors.RESULTS_SCORE)
-                        
-                        if len(team_elems) >= 2 and len(score_elems) >= 2:
-                            home = await team_elems[0].inner_text()
-                            away = await team_elems[1].inner_text()
-                            home_score_text = await score_elems[0].inner_text()
-                            away_score_text = await score_elems[1].inner_text()
-                            
-                            # Check if this is our match
-                            if (home.strip() == self.home_team and 
-                                away.strip() == self.away_team):
-                                
-                                # Found our match!
-                                result_data = ResultData(
-                                    match_id=self.match_id,
-                                    league=self.league,
-                                    week=week,
-                                    match_time=time_text.strip(),
-                                    home_team=home.strip(),
-                                    away_team=away.strip(),
-                                    home_score=int(home_score_text.strip()),
-                                    away_score=int(away_score_text.strip())
-                                )
-                                
-                                self.logger.data_collected("result")
-                                return result_data
+            self._results_index = self._index_results(result_blocks)
+            self._results_index_at = time.monotonic()
+            
+            result_data = self._lookup_result(match_id, home_team, away_team)
+            if result_data:
+                self.logger.data_collected("result")
+                return result_data
             
             self.logger.warning("Match not found in results")
             return None
@@ -161,19 +182,55 @@ class ResultsAgent:
             self.logger.error(f"Error scraping result: {e}")
             return None
     
+    def _index_results(self, result_blocks: List[dict]) -> Dict[Tuple[str, str], tuple]:
+        """
+        Index every finished match on the Results tab by (home, away)
+        
+        Returns:
+            {(home_key, away_key): (week, match_time, home, away, home_score, away_score)}
+        """
+        index = {}
+        for block in result_blocks:
+            title_text = block['title']
+            time_text = block['time']
+            
+            if title_text and time_text:
+                # Extract week info
+                week = self._extract_week(title_text)
+                match_time = time_text.strip()
+                
+                for teams, scores in block['matches']:
+                    if len(teams) >= 2 and len(scores) >= 2 and scores[0].isdigit() and scores[1].isdigit():
+                        home, away = teams[0], teams[1]
+                        # Newest block comes first - keep the first hit per pairing
+                        index.setdefault(
+                            (home.casefold(), away.casefold()),
+                            (week, match_time, home, away, int(scores[0]), int(scores[1]))
+                        )
+        return index
+    
+    def _lookup_result(self, match_id: str, home_team: str, away_team: str) -> Optional[ResultData]:
+        """Build a ResultData from the current results index, if the match is in it"""
+        entry = self._results_index.get((home_team.strip().casefold(), away_team.strip().casefold()))
+        if entry is None:
+            return None
+        
+        week, match_time, home, away, home_score, away_score = entry
+        return ResultData(
+            match_id=match_id,
+            league=self.league,
+            week=week,
+            match_time=match_time,
+            home_team=home,
+            away_team=away,
+            home_score=home_score,
+            away_score=away_score
+        )
+    
     def _extract_week(self, title_text: str) -> str:
         """Extract week number from title"""
-        try:
-            # Format: "English League WEEK 16 - #2026012209"
-            if "WEEK" in title_text:
-                parts = title_text.split("WEEK")
-                if len(parts) > 1:
-                    week_part = parts[1].split("-")[0].strip()
-                    return f"WEEK {week_part}"
-            return "Unknown"
-            
-        except Exception:
-            return "Unknown"
+        match = _WEEK_RE.search(title_text)
+        return f"WEEK {match.group(1)}" if match else "Unknown"
     
     def _validate_result(self, result_data: ResultData, live_data: dict) -> bool:
         """
@@ -221,6 +278,9 @@ class StandingsAgent:
         self.data_agent = data_agent
         self.league = league
         
+        # Locators are lazy - build once, reuse for every scrape
+        self._standings_tab = page.locator(selectors.TAB_STANDINGS)
+        
         self.logger.info("StandingsAgent initialized")
     
     async def scrape_and_save(self) -> bool:
@@ -230,7 +290,7 @@ class StandingsAgent:
         Returns:
             True if successful
         """
-        self.logger.state_change(self.state.value, AgentState.RUNNING.value)
+        self.logger.state_change(self.state, AgentState.RUNNING)
         self.state = AgentState.RUNNING
         
         try:
@@ -260,67 +320,57 @@ class StandingsAgent:
     async def _navigate_to_standings(self):
         """Navigate to Standings tab"""
         try:
-            standings_tab = await self.page.query_selector(selectors.TAB_STANDINGS)
-            if standings_tab:
-                await standings_tab.click()
-                await asyncio.sleep(1)
+            if await self._standings_tab.count():
+                await self._standings_tab.first.click()
+                await self.page.wait_for_selector(selectors.STANDINGS_CONTAINER,
+                                                  timeout=config.SETTLE_TIMEOUT)
                 self.logger.agent_action("Navigated to Standings tab")
             
         except Exception as e:
             self.logger.error(f"Error navigating to Standings: {e}")
     
-    async def _scrape_standings(self) -> Optional[dict]:
-        """Scrape standings table"""
+    async def _scrape_standings(self) -> Optional[StandingsData]:
+        """Scrape standings table (whole table read in one evaluate call)"""
         try:
-            # Get standings container
-            standings_container = await self.page.query_selector(selectors.STANDINGS_CONTAINER)
-            if not standings_container:
+            table = await self.page.evaluate(STANDINGS_JS, [
+                selectors.STANDINGS_CONTAINER,
+                selectors.STANDINGS_TITLE,
+                selectors.STANDINGS_ROW
+            ])
+            if not table:
                 return None
             
-            # Get title (contains season info)
-            title_elem = await standings_container.query_selector(selectors.STANDINGS_TITLE)
-            season = "Unknown"
-            if title_elem:
-                title_text = await title_elem.inner_text()
-                season = title_text.strip()
-            
-            # Get table rows
-            rows = await standings_container.query_selector_all(selectors.STANDINGS_ROW)
+            # Title contains season info
+            season = table['title'].strip() if table['title'] else "Unknown"
             
             entries = []
-            for row in rows:
-                try:
-                    cells = await row.query_selector_all('td')
-                    if len(cells) >= 4:
-                        position_text = await cells[0].inner_text()
-                        team_text = await cells[1].inner_text()
-                        points_text = await cells[2].inner_text()
-                        
-                        # Extract form
-                        form_elem = cells[3]
-                        form_divs = await form_elem.query_selector_all('div')
-                        form = []
-                        for div in form_divs:
-                            form_letter = await div.inner_text()
-                            form.append(form_letter.strip())
-                        
-                        entry = {
-                            'position': int(position_text.strip()),
-                            'team': team_text.strip(),
-                            'points': int(points_text.strip()),
-                            'form': form
-                        }
-                        entries.append(entry)
+            for row in table['rows']:
+                # Rows with fewer than 4 cells come back as null
+                if row is None:
+                    continue
+                
+                position_text, team_text, points_text, form = row
                 
-                except Exception as e:
+                # Only the numeric cells can fail to parse
+                try:
+                    position = int(position_text)
+                    points = int(points_text)
+                except ValueError as e:
                     self.logger.error(f"Error parsing row: {e}")
                     continue
+                
+                entries.append(StandingsEntry(
+                    position=position,
+                    team=team_text,
+                    points=points,
+                    form=form
+                ))
             
-            standings_data = {
-                'league': self.league,
-                'season': season,
-                'entries': entries
-            }
+            standings_data = StandingsData(
+                league=self.league,
+                season=season,
+                entries=entries
+            )
             
             self.logger.data_collected("standings", len(entries))
             return standings_data
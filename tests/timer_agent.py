@@ -2,7 +2,11 @@
 Timer Agent - monitors all match timers and emits events
 """
 import asyncio
-from typing import Dict, List, Optional, Callable
+import json
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Callable, Tuple
 from datetime import datetime
 from playwright.async_api import Page
 
@@ -10,12 +14,78 @@ from models import AgentState, TimerEvent
 from logger import AgentLogger
 from config import config, selectors
 
+# Active league text, index of the active timer slot (-1 if none) and every
+# slot's text, in one round-trip
+TIMERS_JS = """
+([slotSel, leagueSel]) => {
+    const slots = Array.from(document.querySelectorAll(slotSel));
+    return {
+        league: document.querySelector(leagueSel)?.innerText ?? null,
+        active: slots.findIndex(el => el.classList.contains('active')),
+        timers: slots.map(el => el.innerText.trim())
+    };
+}
+"""
+
+# Defines window.__timersnap() with the selectors baked in, so each tick only
+# ships a tiny call instead of the TIMERS_JS source
+TIMERS_INIT_JS = f"window.__timersnap = () => ({TIMERS_JS.strip()})({json.dumps([selectors.TIMER_SLOT, selectors.LEAGUE_ACTIVE])});"
+
+# Same definition as an evaluate-able function (returns nothing)
+TIMERS_INSTALL_JS = f"() => {{ {TIMERS_INIT_JS} }}"
+
+# Falls back to null if the page was replaced and the helper is not defined yet
+TIMERS_SNAP_CALL = "window.__timersnap ? window.__timersnap() : null"
+
+# Substring of the active logo text -> league id
+LEAGUE_NAMES = (
+    ("English", "english"),
+    ("Spanish", "spanish"),
+    ("Kenyan", "kenyan"),
+    ("Italian", "italian"),
+)
+
+# "MM:SS" countdown
+_TIMER_RE = re.compile(r"(\d+):(\d+)")
+
+@lru_cache(maxsize=1024)
+def _parse_timer(timer_str: Optional[str]) -> Optional[int]:
+    """
+    Parse timer string to seconds
+    
+    Timer strings repeat from tick to tick, so results are memoized.
+    
+    Args:
+        timer_str: Timer string like "01:23" or "12:45"
+        
+    Returns:
+        Total seconds or None if not parseable
+    """
+    if not timer_str:
+        return None
+    
+    # Handle "MM:SS" format
+    match = _TIMER_RE.fullmatch(timer_str)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2))
+    
+    try:
+        # Try parsing as plain number
+        return int(timer_str)
+        
+    except (ValueError, TypeError):
+        return None
+
 class TimerAgent:
     """
     Monitors all match timers across all leagues
     Emits events when timer thresholds are crossed
     """
     
+    # MATCHDAY_START would otherwise fire on every tick above the threshold;
+    # repeats for the same match are collapsed to one per window (seconds)
+    START_EVENT_WINDOW = 10.0
+    
     def __init__(self, page: Page, event_callback: Callable):
         self.agent_name = "TimerAgent"
         self.logger = AgentLogger(self.agent_name)
@@ -26,18 +96,31 @@ class TimerAgent:
         
         # Track timer states
         self.timer_states: Dict[str, Dict[int, str]] = {}  # {league: {index: timer_value}}
-        self.previous_states: Dict[str, Dict[int, str]] = {}
         
-        # Running flag
-        self.running = False
+        # (league, index) -> monotonic time MATCHDAY_START was last emitted
+        self._start_emitted: Dict[Tuple[str, int], float] = {}
+        
+        # Latest timer snapshot, shared with the get_* accessors
+        self._last_snapshot: Optional[dict] = None
+        self._last_snapshot_ts = 0.0
+        
+        # Set by stop(); also wakes the monitor loop out of its wait
+        self._stop_evt = asyncio.Event()
         
         self.logger.info("TimerAgent initialized")
     
     async def start(self):
         """Start monitoring timers"""
-        self.logger.state_change(self.state.value, AgentState.RUNNING.value)
+        self.logger.state_change(self.state, AgentState.RUNNING)
         self.state = AgentState.RUNNING
-        self.running = True
+        self._stop_evt.clear()
+        
+        # Install the snapshot helper on future documents and the current one
+        try:
+            await self.page.add_init_script(TIMERS_INIT_JS)
+            await self.page.evaluate(TIMERS_INSTALL_JS)
+        except Exception as e:
+            self.logger.warning(f"Could not install timer snapshot helper: {e}")
         
         self.logger.info("TimerAgent started - monitoring timers")
         
@@ -46,63 +129,101 @@ class TimerAgent:
     
     async def _monitor_loop(self):
         """Main monitoring loop"""
-        while self.running:
+        # Bound once - these lookups would otherwise repeat every tick
+        stop_evt = self._stop_evt
+        check_timers = self._check_timers
+        next_interval = self._next_interval
+        wait_for = asyncio.wait_for
+        
+        while not stop_evt.is_set():
             try:
-                await self._check_timers()
-                await asyncio.sleep(config.TIMER_CHECK_INTERVAL)
+                min_remaining = await check_timers()
+                interval = next_interval(min_remaining)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitor loop: {e}")
-                await asyncio.sleep(1)  # Brief pause on error
+                interval = 1  # Brief pause on error
+            
+            try:
+                await wait_for(stop_evt.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
     
-    async def _check_timers(self):
-        """Check all visible timers and detect state changes"""
+    def _next_interval(self, min_remaining: Optional[int]) -> float:
+        """
+        Poll interval for the next tick
+        
+        Polls quickly near the stop threshold, and backs off (up to
+        TIMER_IDLE_INTERVAL) while the nearest countdown is far from it.
+        """
+        if min_remaining is None:
+            return config.TIMER_CHECK_INTERVAL
+        
+        headroom = min_remaining - config.MATCHDAY_STOP_THRESHOLD
+        if headroom > 30:
+            return min(config.TIMER_IDLE_INTERVAL, headroom / 2)
+        return config.TIMER_CHECK_INTERVAL
+    
+    async def _check_timers(self) -> Optional[int]:
+        """
+        Check all visible timers and detect state changes
+        
+        Returns:
+            Smallest numeric countdown in seconds, or None if there is none
+        """
+        min_remaining = None
         try:
-            # Get all timer elements
-            timer_elements = await self.page.query_selector_all(selectors.TIMER_SLOT)
+            snapshot = await self._read_timers()
+            timers = snapshot['timers']
+            active_index = snapshot['active']
             
-            if not timer_elements:
-                return
+            if not timers:
+                return None
             
-            current_league = await self._get_current_league()
+            current_league = self._league_from_text(snapshot['league'])
             if not current_league:
-                return
+                return None
             
-            # Initialize league state if needed
-            if current_league not in self.timer_states:
-                self.timer_states[current_league] = {}
-                self.previous_states[current_league] = {}
+            # Hot-loop locals (league state created on first sight)
+            league_states = self.timer_states.setdefault(current_league, {})
+            parse_timer = _parse_timer
+            handle_change = self._handle_timer_change
             
             # Check each timer
-            for index, timer_elem in enumerate(timer_elements):
+            for index, timer_text in enumerate(timers):
                 try:
-                    # Get timer text
-                    timer_text = await timer_elem.inner_text()
-                    timer_text = timer_text.strip()
-                    
-                    # Check if active
-                    is_active = await timer_elem.evaluate("el => el.classList.contains('active')")
+                    seconds = parse_timer(timer_text)
+                    if seconds is not None and (min_remaining is None or seconds < min_remaining):
+                        min_remaining = seconds
                     
                     # Store current state
-                    previous_value = self.timer_states[current_league].get(index)
-                    self.timer_states[current_league][index] = timer_text
+                    previous_value = league_states.get(index)
+                    league_states[index] = timer_text
                     
                     # Detect state changes and emit events
                     if previous_value != timer_text:
-                        await self._handle_timer_change(
+                        await handle_change(
                             current_league, 
                             index, 
                             previous_value, 
                             timer_text,
-                            is_active
+                            index == active_index
                         )
                     
                 except Exception as e:
                     self.logger.error(f"Error checking timer {index}: {e}")
                     continue
             
+            # Forget slots that are no longer on the page
+            if len(league_states) > len(timers):
+                for index in [i for i in league_states if i >= len(timers)]:
+                    del league_states[index]
+                    self._start_emitted.pop((current_league, index), None)
+            
         except Exception as e:
             self.logger.error(f"Error in _check_timers: {e}")
+        
+        return min_remaining
     
     async def _handle_timer_change(
         self, 
@@ -114,8 +235,9 @@ class TimerAgent:
     ):
         """Handle timer state change and emit appropriate events"""
         
-        # Parse timer value
-        timer_seconds = self._parse_timer(new_value)
+        # Parse both timer values once
+        timer_seconds = _parse_timer(new_value)
+        old_seconds = _parse_timer(old_value)
         
         # Determine event type
         event_type = None
@@ -129,7 +251,8 @@ class TimerAgent:
             # Numeric timer
             if timer_seconds > config.MATCHDAY_START_THRESHOLD:
                 # Timer > 1 minute - start matchday scraping
-                if old_value is None or self._parse_timer(old_value) != timer_seconds:
+                # Caller only gets here when the timer text changed
+                if self._throttle_start(league, index):
                     event_type = "MATCHDAY_START"
                     self.logger.info(
                         f"Matchday scraping threshold reached", 
@@ -140,7 +263,6 @@ class TimerAgent:
             
             elif timer_seconds <= config.MATCHDAY_STOP_THRESHOLD and timer_seconds > 0:
                 # Timer < 10 seconds - stop matchday, prepare for live
-                old_seconds = self._parse_timer(old_value) if old_value else None
                 if old_seconds is None or old_seconds > config.MATCHDAY_STOP_THRESHOLD:
                     event_type = "MATCHDAY_STOP"
                     self.logger.info(
@@ -161,64 +283,54 @@ class TimerAgent:
             await self.event_callback(event)
             self.logger.agent_action(f"Event emitted: {event_type}", league=league, index=index)
     
-    def _parse_timer(self, timer_str: Optional[str]) -> Optional[int]:
-        """
-        Parse timer string to seconds
-        
-        Args:
-            timer_str: Timer string like "01:23" or "12:45"
-            
-        Returns:
-            Total seconds or None if not parseable
-        """
-        if not timer_str:
-            return None
-        
-        try:
-            # Handle "MM:SS" format
-            if ":" in timer_str:
-                parts = timer_str.split(":")
-                if len(parts) == 2:
-                    minutes = int(parts[0])
-                    seconds = int(parts[1])
-                    return minutes * 60 + seconds
-            
-            # Try parsing as plain number
-            return int(timer_str)
-            
-        except (ValueError, AttributeError):
-            return None
-    
     async def _get_current_league(self) -> Optional[str]:
         """Get currently active league"""
         try:
-            active_league = await self.page.query_selector(selectors.LEAGUE_ACTIVE)
-            if active_league:
-                league_text = await active_league.inner_text()
-                # Extract league name from text
-                if "English" in league_text:
-                    return "english"
-                elif "Spanish" in league_text:
-                    return "spanish"
-                elif "Kenyan" in league_text:
-                    return "kenyan"
-                elif "Italian" in league_text:
-                    return "italian"
-            return None
+            snapshot = await self._current_snapshot()
+            return self._league_from_text(snapshot['league'])
             
         except Exception as e:
             self.logger.error(f"Error getting current league: {e}")
             return None
     
+    def _league_from_text(self, league_text: Optional[str]) -> Optional[str]:
+        """Map the active league logo text to a league id"""
+        if not league_text:
+            return None
+        return next((league for name, league in LEAGUE_NAMES if name in league_text), None)
+    
+    def _throttle_start(self, league: str, index: int) -> bool:
+        """True if MATCHDAY_START for this match has not been emitted within the window"""
+        now = time.monotonic()
+        key = (league, index)
+        if now - self._start_emitted.get(key, float('-inf')) < self.START_EVENT_WINDOW:
+            return False
+        self._start_emitted[key] = now
+        return True
+    
+    async def _read_timers(self) -> dict:
+        """Read the active league and every timer in one evaluate call"""
+        snapshot = await self.page.evaluate(TIMERS_SNAP_CALL)
+        if snapshot is None:
+            # Helper missing on this document - define it, then read
+            await self.page.evaluate(TIMERS_INSTALL_JS)
+            snapshot = await self.page.evaluate(TIMERS_SNAP_CALL)
+        self._last_snapshot = snapshot
+        self._last_snapshot_ts = time.monotonic()
+        return snapshot
+    
+    async def _current_snapshot(self) -> dict:
+        """Latest monitor-loop snapshot, or a fresh read if it is older than one tick"""
+        if (self._last_snapshot is not None and
+                time.monotonic() - self._last_snapshot_ts <= config.TIMER_CHECK_INTERVAL):
+            return self._last_snapshot
+        return await self._read_timers()
+    
     async def get_active_timer_index(self) -> Optional[int]:
         """Get the index of the currently active timer"""
         try:
-            timer_elements = await self.page.query_selector_all(selectors.TIMER_SLOT)
-            for index, timer_elem in enumerate(timer_elements):
-                is_active = await timer_elem.evaluate("el => el.classList.contains('active')")
-                if is_active:
-                    return index
-            return None
+            active_index = (await self._current_snapshot())['active']
+            return active_index if active_index >= 0 else None
             
         except Exception as e:
             self.logger.error(f"Error getting active timer: {e}")
@@ -227,9 +339,9 @@ class TimerAgent:
     async def get_timer_value(self, index: int) -> Optional[str]:
         """Get timer value at specific index"""
         try:
-            timer_elements = await self.page.query_selector_all(selectors.TIMER_SLOT)
-            if 0 <= index < len(timer_elements):
-                return await timer_elements[index].inner_text()
+            timers = (await self._current_snapshot())['timers']
+            if 0 <= index < len(timers):
+                return timers[index]
             return None
             
         except Exception as e:
@@ -238,14 +350,12 @@ class TimerAgent:
     
     async def stop(self):
         """Stop timer monitoring"""
-        self.logger.state_change(self.state.value, AgentState.STOPPING.value)
+        self.logger.state_change(self.state, AgentState.STOPPING)
         self.state = AgentState.STOPPING
-        self.running = False
-        
-        await asyncio.sleep(config.TIMER_CHECK_INTERVAL + 0.1)  # Wait for loop to finish
+        self._stop_evt.set()  # Monitor loop wakes and exits immediately
         
         self.state = AgentState.STOPPED
-        self.logger.state_change(AgentState.STOPPING.value, self.state.value)
+        self.logger.state_change(AgentState.STOPPING, self.state)
         self.logger.info("TimerAgent stopped")
 
 
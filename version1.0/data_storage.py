@@ -4,19 +4,43 @@ Data Storage Layer - UPSERT-only data storage
 Never deletes or overwrites historical data
 """
 
+import atexit
 import json
 import os
+import shutil
+import threading
 from datetime import datetime
 from typing import Dict, List, Any
 import hashlib
 
+from json_codec import dumps as _dumps, loads as _loads
+
 class JSONDataStorage:
-    """JSON-based data storage with UPSERT semantics"""
+    """
+    JSON-based data storage with UPSERT semantics
+    
+    Each file is loaded into memory once. An upsert updates the in-memory
+    copy and appends the changed record to a JSON-Lines journal next to the
+    file; the full JSON snapshot is only rewritten (with a single backup)
+    when the journal is compacted.
+    """
+    
+    # Journal lines written before the snapshot is rewritten and the journal reset
+    COMPACT_EVERY = 500
+    
+    # Rotating backups kept per file
+    BACKUP_KEEP = 5
     
     def __init__(self, base_path: str = "data"):
         self.base_path = base_path
         self.ensure_directory()
         
+        self._data: Dict[str, Dict[str, Any]] = {}  # {filepath: {record_id: record}}
+        self._pending: Dict[str, int] = {}  # {filepath: journal lines since last compaction}
+        self._lock = threading.RLock()
+        
+        atexit.register(self.flush)
+        
     def ensure_directory(self):
         """Ensure data directory exists"""
         os.makedirs(self.base_path, exist_ok=True)
@@ -25,45 +49,32 @@ class JSONDataStorage:
     def generate_id(self, data: Dict) -> str:
         """Generate unique ID for data record"""
         # Create a hash based on match/league identifying information
+        # (12 hex chars; blake2b is faster than md5 and nothing here needs md5)
         if "match_id" in data:
             return data["match_id"]
         elif "team1" in data and "team2" in data:
             key = f"{data.get('team1', '')}_{data.get('team2', '')}_{data.get('timestamp', '')}"
-            return hashlib.md5(key.encode()).hexdigest()[:12]
+            return hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
         else:
-            return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()[:12]
+            return hashlib.blake2b(json.dumps(data, sort_keys=True).encode(), digest_size=6).hexdigest()
     
     def upsert_match(self, match_data: Dict, filepath: str = "matches.json"):
         """UPSERT match data (update if exists, insert if new)"""
-        full_path = os.path.join(self.base_path, filepath)
-        
         try:
-            # Load existing data
-            existing_data = []
-            if os.path.exists(full_path):
-                with open(full_path, 'r') as f:
-                    existing_data = json.load(f)
-            
-            # Find existing match
-            match_id = self.generate_id(match_data)
-            found = False
-            
-            for i, existing in enumerate(existing_data):
-                if self.generate_id(existing) == match_id:
+            with self._lock:
+                existing_data = self._load(filepath)
+                
+                # Matches are keyed by id - one dict lookup, no per-record rehash
+                match_id = self.generate_id(match_data)
+                
+                if match_id in existing_data:
                     # Update existing record
-                    existing_data[i] = self.merge_data(existing, match_data)
-                    found = True
-                    break
-            
-            # If not found, insert new
-            if not found:
-                existing_data.append(match_data)
-            
-            # Save with backup
-            self.create_backup(full_path)
-            
-            with open(full_path, 'w') as f:
-                json.dump(existing_data, f, indent=2, default=str)
+                    existing_data[match_id] = self.merge_data(existing_data[match_id], match_data)
+                else:
+                    # If not found, insert new
+                    existing_data[match_id] = match_data
+                
+                self._append(filepath, match_id, existing_data[match_id])
             
             print(f"Upserted match data: {match_id}")
             return True
@@ -74,36 +85,30 @@ class JSONDataStorage:
     
     def upsert_odds(self, match_id: str, odds_data: Dict, filepath: str = "odds.json"):
         """UPSERT odds data"""
-        full_path = os.path.join(self.base_path, filepath)
-        
         try:
-            # Load existing data
-            existing_data = {}
-            if os.path.exists(full_path):
-                with open(full_path, 'r') as f:
-                    existing_data = json.load(f)
-            
-            # Get or create match odds
-            if match_id not in existing_data:
-                existing_data[match_id] = {}
-            
-            # Merge odds data (preserve old, add new)
-            for market, odds in odds_data.items():
-                if market not in existing_data[match_id]:
-                    existing_data[match_id][market] = []
+            with self._lock:
+                existing_data = self._load(filepath)
                 
-                # Add new odds entry with timestamp
-                odds_entry = {
-                    "odds": odds,
-                    "timestamp": datetime.now().isoformat()
-                }
-                existing_data[match_id][market].append(odds_entry)
-            
-            # Save with backup
-            self.create_backup(full_path)
-            
-            with open(full_path, 'w') as f:
-                json.dump(existing_data, f, indent=2, default=str)
+                # Get or create match odds
+                if match_id not in existing_data:
+                    existing_data[match_id] = {}
+                
+                # Merge odds data (preserve old, add new)
+                added = {}
+                for market, odds in odds_data.items():
+                    if market not in existing_data[match_id]:
+                        existing_data[match_id][market] = []
+                    
+                    # Add new odds entry with timestamp
+                    odds_entry = {
+                        "odds": odds,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    existing_data[match_id][market].append(odds_entry)
+                    added[market] = odds_entry
+                
+                # Journal only the new entries, not the whole odds history
+                self._append(filepath, match_id, added, delta=True)
             
             print(f"Upserted odds for match: {match_id}")
             return True
@@ -114,32 +119,14 @@ class JSONDataStorage:
     
     def upsert_goals(self, match_id: str, goals: List[int], filepath: str = "goals.json"):
         """UPSERT goal data (append-only)"""
-        full_path = os.path.join(self.base_path, filepath)
-        
         try:
-            # Load existing data
-            existing_data = {}
-            if os.path.exists(full_path):
-                with open(full_path, 'r') as f:
-                    existing_data = json.load(f)
-            
-            # Get or create match goals
-            if match_id not in existing_data:
-                existing_data[match_id] = []
-            
-            # Append new goals (avoid duplicates)
-            for goal in goals:
-                if goal not in existing_data[match_id]:
-                    existing_data[match_id].append(goal)
-            
-            # Sort goals chronologically
-            existing_data[match_id].sort()
-            
-            # Save with backup
-            self.create_backup(full_path)
-            
-            with open(full_path, 'w') as f:
-                json.dump(existing_data, f, indent=2, default=str)
+            with self._lock:
+                existing_data = self._load(filepath)
+                
+                # Union with recorded goals (avoids duplicates), sorted chronologically
+                existing_data[match_id] = sorted(set(existing_data.get(match_id, [])).union(goals))
+                
+                self._append(filepath, match_id, existing_data[match_id])
             
             print(f"Upserted goals for match: {match_id}")
             return True
@@ -158,10 +145,15 @@ class JSONDataStorage:
             elif isinstance(value, dict) and isinstance(merged[key], dict):
                 merged[key] = self.merge_data(merged[key], value)
             elif isinstance(value, list) and isinstance(merged[key], list):
-                # Append new items, avoid duplicates
+                # Append new items, avoid duplicates (set lookup, not a list scan)
+                seen = {self._item_key(item) for item in merged[key]}
+                new_items = []
                 for item in value:
-                    if item not in merged[key]:
-                        merged[key].append(item)
+                    item_key = self._item_key(item)
+                    if item_key not in seen:
+                        seen.add(item_key)
+                        new_items.append(item)
+                merged[key] = merged[key] + new_items
             elif key in ["last_updated", "scraped_at"]:
                 # Always update timestamps
                 merged[key] = value
@@ -169,15 +161,136 @@ class JSONDataStorage:
         
         return merged
     
+    def _journal_path(self, filepath: str) -> str:
+        """Path of the JSON-Lines journal kept next to a snapshot file"""
+        return os.path.splitext(os.path.join(self.base_path, filepath))[0] + ".jsonl"
+    
+    def _load(self, filepath: str) -> Dict[str, Any]:
+        """Return the in-memory records for a file, loading snapshot + journal on first use"""
+        if filepath in self._data:
+            return self._data[filepath]
+        
+        full_path = os.path.join(self.base_path, filepath)
+        data = {}
+        
+        if os.path.exists(full_path):
+            with open(full_path, 'rb') as f:
+                snapshot = _loads(f.read())
+            if isinstance(snapshot, list):
+                # Older matches.json files are a JSON array - key them once on load
+                data = {self.generate_id(record): record for record in snapshot}
+            else:
+                data = snapshot
+        
+        # Replay records journaled since the last compaction (last one wins)
+        pending = 0
+        journal_path = self._journal_path(filepath)
+        if os.path.exists(journal_path):
+            with open(journal_path, 'rb') as f:
+                journal = f.read()
+            
+            # Drop a torn final line from an interrupted write, so the next
+            # append starts on a fresh line instead of merging into it
+            if journal and not journal.endswith(b"\n"):
+                journal = journal[:journal.rfind(b"\n") + 1]
+                with open(journal_path, 'r+b') as f:
+                    f.truncate(len(journal))
+            
+            for line in journal.splitlines():
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    continue
+                if "append" in entry:
+                    # Odds delta - append each market's new entry to its history
+                    record = data.setdefault(entry["id"], {})
+                    for market, odds_entry in entry["append"].items():
+                        record.setdefault(market, []).append(odds_entry)
+                else:
+                    data[entry["id"]] = entry["record"]
+                pending += 1
+        
+        self._data[filepath] = data
+        self._pending[filepath] = pending
+        return data
+    
+    def _append(self, filepath: str, record_id: str, record: Any, delta: bool = False):
+        """
+        Journal one changed record; compact once the journal is long enough
+        
+        With delta=True, record is a {market: odds_entry} mapping that is
+        appended to the stored record on replay instead of replacing it.
+        """
+        entry = {"id": record_id, "append" if delta else "record": record}
+        with open(self._journal_path(filepath), 'ab') as f:
+            f.write(_dumps(entry) + b"\n")
+        
+        self._pending[filepath] += 1
+        if self._pending[filepath] >= self.COMPACT_EVERY:
+            self._compact(filepath)
+    
+    def _compact(self, filepath: str):
+        """Rewrite the full snapshot from memory and reset its journal"""
+        full_path = os.path.join(self.base_path, filepath)
+        data = self._data[filepath]
+        
+        # Save with backup
+        self.create_backup(full_path)
+        
+        tmp_path = full_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(data, pretty=True))
+        os.replace(tmp_path, full_path)
+        
+        journal_path = self._journal_path(filepath)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        self._pending[filepath] = 0
+    
+    def flush(self):
+        """Compact every file with journaled changes (also runs at exit)"""
+        with self._lock:
+            for filepath, pending in list(self._pending.items()):
+                if pending:
+                    try:
+                        self._compact(filepath)
+                    except Exception as e:
+                        print(f"Error compacting {filepath}: {e}")
+    
+    def _item_key(self, item: Any) -> Any:
+        """Hashable stand-in for a list item (dicts/lists are keyed by their JSON form)"""
+        if isinstance(item, (dict, list)):
+            return json.dumps(item, sort_keys=True, default=str)
+        return item
+    
     def create_backup(self, filepath: str):
-        """Create backup of existing file"""
+        """
+        Create backup of existing file
+        
+        The backup is a hard link to the current file, which is then swapped
+        out with os.replace - no bytes are copied. Only the newest
+        BACKUP_KEEP backups per file are kept.
+        """
         try:
             if os.path.exists(filepath):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_name = f"{os.path.basename(filepath)}.{timestamp}.bak"
-                backup_path = os.path.join(self.base_path, "backups", backup_name)
+                base_name = os.path.basename(filepath)
+                backup_dir = os.path.join(self.base_path, "backups")
+                backup_path = os.path.join(backup_dir, f"{base_name}.{timestamp}.bak")
+                
+                if not os.path.exists(backup_path):
+                    try:
+                        os.link(filepath, backup_path)
+                    except OSError:
+                        # Filesystem without hard links
+                        shutil.copy2(filepath, backup_path)
                 
-                with open(filepath, 'r') as source, open(backup_path, 'w') as target:
-                    target.write(source.read())
+                # Prune to the newest BACKUP_KEEP (timestamped names sort chronologically)
+                backups = sorted(
+                    name for name in os.listdir(backup_dir)
+                    if name.startswith(f"{base_name}.") and name.endswith(".bak")
+                )
+                for name in backups[:-self.BACKUP_KEEP]:
+                    os.remove(os.path.join(backup_dir, name))
         except Exception as e:
             print(f"Error creating backup: {e}")
\ No newline at end of file
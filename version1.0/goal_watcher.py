@@ -5,8 +5,18 @@ Only active while match is LIVE, append-only recording
 """
 
 import threading
-import time
-from typing import List, Set
+from typing import List, Optional, Set
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from state_manager import MatchState
+
+# Goal-minute texts for each match element passed in, in one WebDriver call
+GOAL_MINUTES_JS = """
+return arguments[0].map(g =>
+    Array.from(g.querySelectorAll('div.hi span')).map(s => s.innerText.trim())
+);
+"""
 
 class GoalWatcher:
     """Watches for goal events during LIVE matches"""
@@ -14,82 +24,140 @@ class GoalWatcher:
     def __init__(self, driver):
         self.driver = driver
         self.watched_matches = {}  # match_id -> set of recorded minutes
+        self._live = {}  # match_id -> match element, polled by the watch thread
+        self._state_manager = None
+        self._thread = None
+        self._lock = threading.Lock()
         self._stop_event = threading.Event()
         
-    def extract_goal_minutes(self, match_element) -> List[int]:
-        """Extract goal minutes from match element"""
-        goal_minutes = []
+    def extract_goal_minutes(self, match_elements: List) -> List[Optional[List[int]]]:
+        """
+        Extract goal minutes for several match elements with one script call
         
+        If an element has gone stale, the whole call fails, so each element is
+        then read separately. Stale elements map to None instead of minutes.
+        """
         try:
-            # Find all goal minute spans
-            minute_spans = match_element.find_elements(
-                By.CSS_SELECTOR, "div.hi span"
-            )
+            texts_per_match = self.driver.execute_script(GOAL_MINUTES_JS, match_elements)
+        except StaleElementReferenceException:
+            texts_per_match = [self._read_goal_texts(element) for element in match_elements]
+        except Exception as e:
+            print(f"Error extracting goal minutes: {e}")
+            return [[] for _ in match_elements]
+        
+        all_minutes = []
+        for texts in texts_per_match:
+            if texts is None:
+                all_minutes.append(None)
+                continue
             
-            for span in minute_spans:
-                text = span.text.strip()
+            goal_minutes = []
+            for text in texts:
                 if "'" in text:
                     try:
                         minute = int(text.replace("'", ""))
                         goal_minutes.append(minute)
                     except ValueError:
                         continue
+            all_minutes.append(goal_minutes)
         
+        return all_minutes
+    
+    def _read_goal_texts(self, match_element) -> Optional[List[str]]:
+        """Goal-minute texts of a single match element, or None if it is stale"""
+        try:
+            return self.driver.execute_script(GOAL_MINUTES_JS, [match_element])[0]
+        except StaleElementReferenceException:
+            return None
         except Exception as e:
             print(f"Error extracting goal minutes: {e}")
-        
-        return goal_minutes
+            return []
     
     def watch_match_goals(self, match_id: str, match_element, state_manager):
-        """Watch for goals in a specific LIVE match"""
-        
-        def watch_task():
-            try:
-                # Initialize recorded minutes for this match
-                if match_id not in self.watched_matches:
-                    self.watched_matches[match_id] = set()
-                
-                last_goals = set()
-                
-                while not self._stop_event.is_set():
-                    # Check if match is still LIVE
-                    match_record = state_manager.get_match(match_id)
-                    if not match_record or match_record.state != MatchState.LIVE:
-                        break
-                    
-                    # Extract current goal minutes
-                    current_goal_minutes = self.extract_goal_minutes(match_element)
-                    current_goals_set = set(current_goal_minutes)
-                    
-                    # Find new goals
-                    new_goals = current_goals_set - self.watched_matches[match_id]
-                    
-                    # Record new goals
-                    for minute in sorted(new_goals):
-                        if state_manager.add_goal(match_id, minute):
-                            self.watched_matches[match_id].add(minute)
-                            print(f"Goal recorded for {match_id} at {minute}'")
-                    
-                    # Update last known goals
-                    last_goals = current_goals_set
-                    
-                    time.sleep(1)  # Check every second
-                    
-            except Exception as e:
-                print(f"Error watching goals for {match_id}: {e}")
-        
-        thread = threading.Thread(target=watch_task)
-        thread.daemon = True
-        thread.start()
+        """Add a LIVE match to the shared goal-polling loop"""
+        with self._lock:
+            # Initialize recorded minutes for this match
+            if match_id not in self.watched_matches:
+                self.watched_matches[match_id] = set()
+            
+            self._live[match_id] = match_element
+            self._state_manager = state_manager
+            
+            # One thread polls every LIVE match; start it if it is not running
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._watch_loop)
+                self._thread.daemon = True
+                self._thread.start()
+            
+            return self._thread
+    
+    def _watch_loop(self):
+        """Poll all watched LIVE matches in turn, once per second"""
+        while not self._stop_event.is_set():
+            with self._lock:
+                if not self._live:
+                    # Nothing LIVE - exit; the next watch_match_goals restarts the loop
+                    self._thread = None
+                    return
+                live = list(self._live.items())
+                state_manager = self._state_manager
+            
+            # One round-trip reads the goal minutes of every LIVE match
+            minutes_per_match = self.extract_goal_minutes([element for _, element in live])
+            
+            for (match_id, _), goal_minutes in zip(live, minutes_per_match):
+                # A stale element (None) drops just that match from the loop
+                if goal_minutes is None or not self._poll_match(match_id, goal_minutes, state_manager):
+                    # Finished matches drop their recorded minutes too, so memory
+                    # is bounded by the matches currently LIVE
+                    with self._lock:
+                        self._live.pop(match_id, None)
+                        self.watched_matches.pop(match_id, None)
+            
+            self._stop_event.wait(1)  # Check every second
+    
+    def _poll_match(self, match_id: str, goal_minutes: List[int], state_manager) -> bool:
+        """
+        Record any new goals for one match
         
-        return thread
+        Returns:
+            False once the match should no longer be watched
+        """
+        try:
+            # Check if match is still LIVE
+            match_record = state_manager.get_match(match_id)
+            if not match_record or match_record.state != MatchState.LIVE:
+                return False
+            
+            recorded = self.watched_matches.get(match_id)
+            if recorded is None:
+                return False
+            
+            # Find new goals
+            new_goals = set(goal_minutes) - recorded
+            
+            # Record new goals
+            for minute in sorted(new_goals):
+                if state_manager.add_goal(match_id, minute):
+                    recorded.add(minute)
+                    print(f"Goal recorded for {match_id} at {minute}'")
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error watching goals for {match_id}: {e}")
+            return False
     
     def stop_watching(self, match_id: str):
         """Stop watching goals for a specific match"""
-        if match_id in self.watched_matches:
-            del self.watched_matches[match_id]
+        with self._lock:
+            self._live.pop(match_id, None)
+            if match_id in self.watched_matches:
+                del self.watched_matches[match_id]
     
     def stop_all(self):
         """Stop all goal watching"""
         self._stop_event.set()
-        self.watched_matches.clear()
\ No newline at end of file
+        with self._lock:
+            self._live.clear()
+            self.watched_matches.clear()
\ No newline at end of file
@@ -0,0 +1,23 @@
+# json_codec.py
+"""
+JSON Codec - orjson when installed, stdlib json otherwise
+dumps() always returns bytes, so files are written in binary mode
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    
+    def dumps(obj: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+    
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2, default=str).encode()
+        return json.dumps(obj, separators=(",", ":"), default=str).encode()
+    
+    loads = json.loads
@@ -7,9 +7,20 @@ Each league operates independently and in parallel
 import threading
 import time
 from typing import List, Dict
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 
+# [element, [team names]] for every match card, in one WebDriver call
+MATCHES_JS = """
+return Array.from(document.querySelectorAll('div.game.e')).map(g => [
+    g,
+    Array.from(g.querySelectorAll('div.t-l')).map(n => n.innerText.trim())
+]);
+"""
+
+# All controllers share one WebDriver session: a league's click and the scrape
+# of its match list must not interleave with another league's click
+_driver_lock = threading.Lock()
+
 class LeagueController:
     """Controls scraping for a single league"""
     
@@ -42,22 +53,17 @@ class LeagueController:
         
         try:
             matches = []
-            match_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, "div.game.e"
-            )
+            match_rows = self.driver.execute_script(MATCHES_JS)
+            scraped_at = int(time.time())
             
-            for i, match_elem in enumerate(match_elements):
+            for i, (match_elem, team_names) in enumerate(match_rows):
                 try:
                     # Extract match information
-                    team_elements = match_elem.find_elements(
-                        By.CSS_SELECTOR, "div.t-l"
-                    )
-                    
-                    if len(team_elements) >= 2:
-                        team1 = team_elements[0].text.strip()
-                        team2 = team_elements[1].text.strip()
+                    if len(team_names) >= 2:
+                        team1 = team_names[0]
+                        team2 = team_names[1]
                         
-                        match_id = f"{self.league_name}_{team1}_{team2}_{int(time.time())}"
+                        match_id = f"{self.league_name}_{team1}_{team2}_{scraped_at}"
                         
                         matches.append({
                             "match_id": match_id,
@@ -85,14 +91,15 @@ class LeagueController:
         
         def scrape_task():
             try:
-                # Activate league
-                if not self.activate_league():
-                    return
-                
-                # Scrape matches
-                matches = self.scrape_matches()
+                with _driver_lock:
+                    # Activate league
+                    if not self.activate_league():
+                        return
+                    
+                    # Scrape matches
+                    matches = self.scrape_matches()
                 
-                # Process each match
+                # Process each match (state manager only - no driver lock needed)
                 for match_info in matches:
                     if self._stop_event.is_set():
                         break
@@ -118,6 +125,10 @@ class LeagueController:
         
         return thread
     
+    def reset(self):
+        """Re-arm a stopped controller for the next round"""
+        self._stop_event.clear()
+    
     def stop(self):
         """Stop scraping for this league"""
         self._stop_event.set()
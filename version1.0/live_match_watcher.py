@@ -5,16 +5,70 @@ Hard trigger that immediately stops odds scraping
 """
 
 import re
+import threading
 import time
 from typing import List, Dict, Optional
-from selenium.webdriver.common.by import By
+
+from selenium_helpers import fast_wait
+from state_manager import MatchState
+
+# Attaches a MutationObserver to the live tracker (re-attaching if the tracker
+# was re-rendered) and returns whether it changed since the last call.
+# Returns null when there is no tracker to observe.
+TRACKER_CHANGED_JS = """
+const tracker = document.querySelector('div.play');
+if (!tracker) return null;
+if (window.__liveObsTarget !== tracker) {
+    if (window.__liveObs) window.__liveObs.disconnect();
+    window.__liveObs = new MutationObserver(() => { window.__liveDirty = true; });
+    window.__liveObs.observe(tracker, {
+        childList: true, subtree: true, characterData: true,
+        attributes: true, attributeFilter: ['class']
+    });
+    window.__liveObsTarget = tracker;
+    window.__liveDirty = true;
+}
+const dirty = window.__liveDirty;
+window.__liveDirty = false;
+return dirty;
+"""
+
+# Extracts [element, team1, team2, current_minute] for every match in the
+# live tracker in a single round-trip; the minute is the highest "NN'" span.
+LIVE_MATCHES_JS = """
+const tracker = document.querySelector('div.play.show');
+if (!tracker) return [];
+const text = (m, sel) => {
+    const el = m.querySelector(sel);
+    return el ? el.textContent.trim() : '';
+};
+return Array.from(tracker.querySelectorAll('div.gm')).map(m => {
+    const minutes = Array.from(m.querySelectorAll('div.hi span'))
+        .map(s => s.textContent.trim())
+        .filter(t => t.includes("'"))
+        .map(t => parseInt(t.replace("'", ''), 10))
+        .filter(n => !isNaN(n));
+    return [m, text(m, 'span.t-1-j'), text(m, 'span.t-2-j'),
+            minutes.length ? Math.max(...minutes) : null];
+});
+"""
+
+# Clicks the first LIVE tab that isn't active yet and returns it (null if
+# there is none), so the tab probe and the click share one round-trip
+LIVE_TAB_CLICK_JS = """
+const tab = Array.from(document.querySelectorAll('li.live'))
+    .find(t => !t.classList.contains('active'));
+if (tab) tab.click();
+return tab || null;
+"""
 
 class LiveMatchWatcher:
     """Watches for matches becoming LIVE"""
     
     def __init__(self, driver):
         self.driver = driver
-        self.live_matches = set()
+        self.live_matches = set()  # Match IDs already flagged LIVE
+        self._lock = threading.Lock()
         self._stop_event = threading.Event()
         
     def check_for_live(self) -> List[Dict]:
@@ -22,65 +76,21 @@ class LiveMatchWatcher:
         live_matches = []
         
         try:
-            # Check for LIVE indicator in tabs
-            live_tabs = self.driver.find_elements(
-                By.CSS_SELECTOR, "li.live"
-            )
+            # Click on LIVE tab to see live matches
+            tab = self.driver.execute_script(LIVE_TAB_CLICK_JS)
+            if tab is not None:
+                fast_wait(self.driver, lambda d: "active" in tab.get_attribute("class"))
             
-            if live_tabs:
-                # Click on LIVE tab to see live matches
-                for tab in live_tabs:
-                    if "active" not in tab.get_attribute("class"):
-                        tab.click()
-                        time.sleep(1)
-                        break
+            # One script call extracts every live match from the tracker
+            rows = self.driver.execute_script(LIVE_MATCHES_JS)
             
-            # Check live match tracker
-            live_tracker = self.driver.find_element(
-                By.CSS_SELECTOR, "div.play.show"
-            )
-            
-            if live_tracker:
-                live_match_elements = live_tracker.find_elements(
-                    By.CSS_SELECTOR, "div.gm"
-                )
-                
-                for match_elem in live_match_elements:
-                    try:
-                        # Extract team names
-                        team1_elem = match_elem.find_element(
-                            By.CSS_SELECTOR, "span.t-1-j"
-                        )
-                        team2_elem = match_elem.find_element(
-                            By.CSS_SELECTOR, "span.t-2-j"
-                        )
-                        
-                        team1 = team1_elem.text.strip()
-                        team2 = team2_elem.text.strip()
-                        
-                        # Extract current minute
-                        minute_spans = match_elem.find_elements(
-                            By.CSS_SELECTOR, "div.hi span"
-                        )
-                        
-                        current_minute = None
-                        for span in minute_spans:
-                            text = span.text.strip()
-                            if "'" in text:
-                                minute = int(text.replace("'", ""))
-                                if current_minute is None or minute > current_minute:
-                                    current_minute = minute
-                        
-                        live_matches.append({
-                            "team1": team1,
-                            "team2": team2,
-                            "current_minute": current_minute,
-                            "element": match_elem
-                        })
-                        
-                    except Exception as e:
-                        print(f"Error parsing live match: {e}")
-                        continue
+            for match_elem, team1, team2, current_minute in rows:
+                live_matches.append({
+                    "team1": team1,
+                    "team2": team2,
+                    "current_minute": current_minute,
+                    "element": match_elem
+                })
         
         except Exception as e:
             # No live matches or error
@@ -88,31 +98,66 @@ class LiveMatchWatcher:
         
         return live_matches
     
+    # Full re-check cadence while there is no tracker to observe
+    FALLBACK_CHECK_INTERVAL = 2.0
+    # How often the observer's change flag is drained
+    CHANGE_POLL_INTERVAL = 0.5
+    
+    def tracker_changed(self) -> Optional[bool]:
+        """
+        Drain the tracker's MutationObserver flag in one small script call
+        
+        Returns:
+            True/False if the tracker changed since the last call, None if
+            there is no tracker on the page to observe
+        """
+        try:
+            return self.driver.execute_script(TRACKER_CHANGED_JS)
+        except Exception:
+            return None
+    
     def watch_live_matches(self, state_manager, on_live_detected=None):
         """Continuously watch for LIVE matches"""
         
         def watch_task():
             try:
+                last_check = 0.0
                 while not self._stop_event.is_set():
+                    # Only run the full DOM check when the tracker actually changed
+                    changed = self.tracker_changed()
+                    now = time.monotonic()
+                    if changed is None:
+                        # No tracker to observe - fall back to a periodic full check
+                        changed = now - last_check >= self.FALLBACK_CHECK_INTERVAL
+                    if not changed:
+                        self._stop_event.wait(self.CHANGE_POLL_INTERVAL)
+                        continue
+                    
+                    last_check = now
                     live_matches = self.check_for_live()
                     
                     for match_info in live_matches:
-                        # Create match ID pattern
-                        match_id_pattern = f"{match_info['team1']}_{match_info['team2']}"
-                        
                         # Find matching match in state manager
-                        for match_id, match_record in state_manager.matches.items():
-                            if (match_info['team1'] in match_record.team1 and 
-                                match_info['team2'] in match_record.team2):
-                                
-                                # Update to LIVE state
-                                if state_manager.update_match_state(match_id, MatchState.LIVE):
-                                    print(f"Match {match_id} is now LIVE")
-                                    
-                                    if on_live_detected:
-                                        on_live_detected(match_id, match_info)
+                        match_id = state_manager.find_match_by_teams(
+                            match_info['team1'], match_info['team2']
+                        )
+                        if match_id is None:
+                            continue
+                        
+                        with self._lock:
+                            if match_id in self.live_matches:
+                                continue
+                        
+                        # Update to LIVE state
+                        if state_manager.update_match_state(match_id, MatchState.LIVE):
+                            print(f"Match {match_id} is now LIVE")
+                            with self._lock:
+                                self.live_matches.add(match_id)
+                            
+                            if on_live_detected:
+                                on_live_detected(match_id, match_info)
                     
-                    time.sleep(2)  # Check every 2 seconds
+                    self._stop_event.wait(self.CHANGE_POLL_INTERVAL)
                     
             except Exception as e:
                 print(f"Error in live match watching: {e}")
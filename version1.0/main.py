@@ -4,16 +4,17 @@ Main Virtual Sports Scraper
 Orchestrates all components according to workflow
 """
 
+import json
 import os
-import time
 import threading
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
 
 # Import all components
-from config import config
+from config import config, selectors
 from state_manager import CentralStateManager, MatchState
 from page_session_manager import PageSessionManager
 from timer_watcher import TimerWatcher
@@ -25,6 +26,21 @@ from results_scraper import ResultsScraper
 from standings_scraper import StandingsScraper
 from data_storage import JSONDataStorage
 
+# Locators resolved once at import
+LEAGUE_ITEM_LOC = (By.CSS_SELECTOR, selectors.LEAGUE_ITEM)
+LEAGUE_NAME_LOC = (By.CSS_SELECTOR, "div.text-xs")
+
+# [[button, text], ...] for the market buttons plus the dropdown option
+# names (first placeholder option skipped, null without a dropdown), in one call
+MARKETS_JS = """
+const buttons = Array.from(document.querySelectorAll(%s)).map(b => [b, b.innerText]);
+const dropdown = document.querySelector(%s);
+const options = dropdown
+    ? Array.from(dropdown.options).slice(1).map(o => o.text.trim())
+    : null;
+return [buttons, options];
+""" % (json.dumps(selectors.MARKET_BUTTONS), json.dumps(selectors.MARKET_DROPDOWN))
+
 class VirtualSportsScraper:
     """Main orchestrator for the virtual sports scraper"""
     
@@ -46,7 +62,9 @@ class VirtualSportsScraper:
         # Control flags
         self.is_running = False
         self.scraping_active = False
+        self._controllers_initialized = False
         self._stop_event = threading.Event()
+        self._save_timer = None
         
     def setup_browser(self):
         """Setup Chrome browser with appropriate options"""
@@ -128,14 +146,15 @@ class VirtualSportsScraper:
         print("Starting odds scraping for new round...")
         self.scraping_active = True
         
-        # Initialize league controllers
-        self.initialize_leagues()
+        # League controllers and market scrapers are built once and reused
+        self.initialize_controllers()
         
-        # Initialize market scrapers
-        self.initialize_markets()
+        for market_scraper in self.market_scrapers:
+            market_scraper.reset()
         
         # Start scraping for each league
         for league_controller in self.league_controllers:
+            league_controller.reset()
             league_controller.start_scraping(
                 self.state_manager,
                 on_complete=self.on_league_scraping_complete
@@ -152,17 +171,31 @@ class VirtualSportsScraper:
         for market_scraper in self.market_scrapers:
             market_scraper.stop()
     
+    def initialize_controllers(self, force: bool = False):
+        """
+        Build league controllers and market scrapers once per session
+        
+        Leagues and markets don't change between rounds; pass force=True
+        after a page reload, when the cached elements have gone stale.
+        """
+        if self._controllers_initialized and not force:
+            return
+        
+        self.league_controllers = []
+        self.market_scrapers = []
+        self.initialize_leagues()
+        self.initialize_markets()
+        
+        # Retry next round if the page wasn't ready yet
+        self._controllers_initialized = bool(self.league_controllers)
+    
     def initialize_leagues(self):
         """Initialize controllers for all leagues"""
         try:
-            league_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, config.SELECTORS["LEAGUE_ITEM"]
-            )
+            league_elements = self.driver.find_elements(*LEAGUE_ITEM_LOC)
             
             for elem in league_elements:
-                league_name_elem = elem.find_element(
-                    By.CSS_SELECTOR, "div.text-xs"
-                )
+                league_name_elem = elem.find_element(*LEAGUE_NAME_LOC)
                 league_name = league_name_elem.text.strip()
                 
                 controller = LeagueController(
@@ -180,45 +213,31 @@ class VirtualSportsScraper:
     def initialize_markets(self):
         """Initialize scrapers for all markets"""
         try:
+            # Buttons and dropdown options in one round-trip
+            market_buttons, dropdown_options = self.driver.execute_script(MARKETS_JS)
+            
             # Main markets (1X2, GG/NG, Double Chance)
             main_markets = ["1X2", "GG/NG", "Double Chance"]
             
             for market_name in main_markets:
-                try:
-                    # Find market button
-                    market_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR, config.SELECTORS["MARKET_BUTTONS"]
-                    )
-                    
-                    for button in market_buttons:
-                        if market_name in button.text:
-                            scraper = MarketScraper(
-                                self.driver, 
-                                market_name, 
-                                button
-                            )
-                            self.market_scrapers.append(scraper)
-                            break
-                            
-                except Exception as e:
-                    print(f"Error initializing market {market_name}: {e}")
-                    continue
+                for button, button_text in market_buttons:
+                    if market_name in button_text:
+                        scraper = MarketScraper(
+                            self.driver, 
+                            market_name, 
+                            button
+                        )
+                        self.market_scrapers.append(scraper)
+                        break
             
             # Dropdown markets (26+)
-            try:
-                dropdown = self.driver.find_element(
-                    By.CSS_SELECTOR, config.SELECTORS["MARKET_DROPDOWN"]
-                )
-                options = dropdown.find_elements(By.TAG_NAME, "option")
-                
-                for option in options[1:]:  # Skip first option
-                    market_name = option.text.strip()
+            if dropdown_options is None:
+                print("Error initializing dropdown markets: dropdown not found")
+            else:
+                for market_name in dropdown_options:
                     if market_name:
                         scraper = MarketScraper(self.driver, market_name)
                         self.market_scrapers.append(scraper)
-                        
-            except Exception as e:
-                print(f"Error initializing dropdown markets: {e}")
             
             print(f"Initialized {len(self.market_scrapers)} market scrapers")
             
@@ -232,6 +251,24 @@ class VirtualSportsScraper:
         # Save state to JSON
         self.state_manager.save_to_json(config.JSON_STORAGE_PATH)
     
+    def _schedule_save(self):
+        """Arm the one-shot timer for the next auto-save"""
+        if self._stop_event.is_set():
+            return
+        self._save_timer = threading.Timer(config.AUTO_SAVE_INTERVAL, self._periodic_save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def _periodic_save(self):
+        """Save state, then reschedule the next auto-save"""
+        try:
+            self.state_manager.save_to_json(config.JSON_STORAGE_PATH)
+            print("Auto-saved state")
+        except Exception as e:
+            print(f"Error auto-saving state: {e}")
+        finally:
+            self._schedule_save()
+    
     def run(self):
         """Main execution loop"""
         try:
@@ -267,21 +304,18 @@ class VirtualSportsScraper:
             
             # Step 4: Start scheduled scrapers
             results_thread = self.results_scraper.run_scheduled(
-                os.path.join(config.BACKUP_STORAGE_PATH, "results.json")
+                os.path.join(config.BACKUP_STORAGE_PATH, "results.jsonl")
             )
             
             standings_thread = self.standings_scraper.run_scheduled(
                 os.path.join(config.BACKUP_STORAGE_PATH, "standings.json")
             )
             
-            # Main loop
-            while not self._stop_event.is_set():
-                # Periodically save state
-                if int(time.time()) % 300 == 0:  # Every 5 minutes
-                    self.state_manager.save_to_json(config.JSON_STORAGE_PATH)
-                    print("Auto-saved state")
-                
-                time.sleep(1)
+            # Periodically save state
+            self._schedule_save()
+            
+            # Main loop: everything runs on worker threads, so just block until shutdown
+            self._stop_event.wait()
             
         except KeyboardInterrupt:
             print("\nShutting down gracefully...")
@@ -297,7 +331,13 @@ class VirtualSportsScraper:
         self.is_running = False
         self._stop_event.set()
         
+        if self._save_timer:
+            self._save_timer.cancel()
+        
         # Stop all components
+        if self.timer_watcher:
+            self.timer_watcher.stop()
+        
         self.stop_odds_scraping()
         
         if self.live_watcher:
@@ -314,6 +354,7 @@ class VirtualSportsScraper:
         
         # Final state save
         self.state_manager.save_to_json(config.JSON_STORAGE_PATH)
+        self.data_storage.flush()
         
         # Close browser
         if self.driver:
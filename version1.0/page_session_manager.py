@@ -8,14 +8,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
 
 class PageSessionManager:
     """Manages page sessions and handles roadblock popup"""
     
+    # Short poll so waits return as soon as the page is actually ready
+    POLL_FREQUENCY = 0.2
+    
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, 10, poll_frequency=self.POLL_FREQUENCY)
     
     def handle_popup(self) -> bool:
         """
@@ -41,9 +43,6 @@ class PageSessionManager:
             
             print("Popup closed successfully")
             
-            # Verify page is interactive
-            time.sleep(1)  # Brief pause for page stabilization
-            
             return True
             
         except TimeoutException:
@@ -84,5 +83,10 @@ class PageSessionManager:
         """Reload page and handle popup again"""
         print("Reloading page...")
         self.driver.refresh()
-        time.sleep(2)
+        try:
+            self.wait.until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            print("Page load did not complete in time")
         return self.ensure_page_ready()
\ No newline at end of file
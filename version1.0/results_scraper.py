@@ -4,29 +4,65 @@ Results Scraper - Scrapes completed match results
 Runs on schedule (every 30 minutes), read-only
 """
 
-import json
+import os
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Set
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from json_codec import dumps, loads
+from selenium_helpers import fast_wait
+
+# Extracts [matchday, timestamp, team1, team2, score1, score2] for every
+# finished match in a single round-trip. Containers without a header and
+# matches without two teams and two numeric scores are skipped.
+RESULTS_JS = """
+const text = el => el ? el.textContent.trim() : null;
+const rows = [];
+for (const c of document.querySelectorAll('div.rs')) {
+    const matchday = text(c.querySelector('div.rs-t div.t'));
+    const timestamp = text(c.querySelector('div.rs-t div.b'));
+    if (matchday === null || timestamp === null) continue;
+    for (const g of c.querySelectorAll('div.rs-g')) {
+        const teams = g.querySelectorAll('div.g-t');
+        const scores = g.querySelectorAll('div.g-s span');
+        if (teams.length < 2 || scores.length < 2) continue;
+        const s1 = parseInt(text(scores[0]), 10);
+        const s2 = parseInt(text(scores[1]), 10);
+        if (isNaN(s1) || isNaN(s2)) continue;
+        rows.push([matchday, timestamp, text(teams[0]), text(teams[1]), s1, s2]);
+    }
+}
+return rows;
+"""
+
+def _dump_line(result: Dict) -> bytes:
+    """One compact JSON line for the results file"""
+    return dumps(result) + b"\n"
 
 class ResultsScraper:
     """Scrapes match results on schedule"""
     
+    COMPACT_INTERVAL = 86400  # Rewrite the results file once a day
+    
     def __init__(self, driver, scrape_interval: int = 1800):  # 30 minutes default
         self.driver = driver
         self.scrape_interval = scrape_interval
         self.last_scrape = None
         self._stop_event = threading.Event()
+        self._seen_keys = None  # Loaded lazily from the results file
         
     def navigate_to_results(self):
         """Navigate to results tab"""
         try:
-            results_tab = self.driver.find_element(
+            # find_elements returns [] instead of raising when nothing is active
+            active_tabs = self.driver.find_elements(
                 By.CSS_SELECTOR, "li.active"  # Adjust selector based on actual HTML
             )
             
-            if "Results" not in results_tab.text:
+            if not active_tabs or "Results" not in active_tabs[0].text:
                 # Find and click results tab
                 all_tabs = self.driver.find_elements(
                     By.CSS_SELECTOR, "ul.tbs li"
@@ -35,7 +71,7 @@ class ResultsScraper:
                 for tab in all_tabs:
                     if "Results" in tab.text:
                         tab.click()
-                        time.sleep(2)
+                        fast_wait(self.driver, EC.presence_of_element_located((By.CSS_SELECTOR, "div.rs")))
                         break
                         
             return True
@@ -51,67 +87,20 @@ class ResultsScraper:
             return results
         
         try:
-            # Find all result containers
-            result_containers = self.driver.find_elements(
-                By.CSS_SELECTOR, "div.rs"
-            )
+            # One script call extracts every result on the page
+            rows = self.driver.execute_script(RESULTS_JS)
+            scraped_at = datetime.now().isoformat()
             
-            for container in result_containers:
-                try:
-                    # Extract matchday info
-                    matchday_info = container.find_element(
-                        By.CSS_SELECTOR, "div.rs-t div.t"
-                    ).text.strip()
-                    
-                    # Extract timestamp
-                    timestamp_elem = container.find_element(
-                        By.CSS_SELECTOR, "div.rs-t div.b"
-                    )
-                    timestamp = timestamp_elem.text.strip()
-                    
-                    # Extract individual matches
-                    match_items = container.find_elements(
-                        By.CSS_SELECTOR, "div.rs-g"
-                    )
-                    
-                    for match_item in match_items:
-                        try:
-                            team_elements = match_item.find_elements(
-                                By.CSS_SELECTOR, "div.g-t"
-                            )
-                            
-                            if len(team_elements) >= 2:
-                                team1 = team_elements[0].text.strip()
-                                team2 = team_elements[1].text.strip()
-                                
-                                # Extract scores
-                                score_elements = match_item.find_elements(
-                                    By.CSS_SELECTOR, "div.g-s span"
-                                )
-                                
-                                if len(score_elements) >= 2:
-                                    score1 = int(score_elements[0].text.strip())
-                                    score2 = int(score_elements[1].text.strip())
-                                    
-                                    result = {
-                                        "matchday": matchday_info,
-                                        "timestamp": timestamp,
-                                        "team1": team1,
-                                        "team2": team2,
-                                        "score1": score1,
-                                        "score2": score2,
-                                        "scraped_at": datetime.now().isoformat()
-                                    }
-                                    
-                                    results.append(result)
-                                    
-                        except Exception as e:
-                            print(f"Error parsing individual result: {e}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"Error parsing result container: {e}")
-                    continue
+            for matchday_info, timestamp, team1, team2, score1, score2 in rows:
+                results.append({
+                    "matchday": matchday_info,
+                    "timestamp": timestamp,
+                    "team1": team1,
+                    "team2": team2,
+                    "score1": score1,
+                    "score2": score2,
+                    "scraped_at": scraped_at
+                })
         
         except Exception as e:
             print(f"Error scraping results: {e}")
@@ -119,61 +108,122 @@ class ResultsScraper:
         print(f"Scraped {len(results)} match results")
         return results
     
+    @staticmethod
+    def _result_key(result: Dict) -> str:
+        """Duplicate-check key for a result"""
+        return f"{result.get('team1', '')}_{result.get('team2', '')}_{result.get('timestamp', '')}"
+    
+    def _migrate_legacy(self, legacy_path: str, filepath: str):
+        """One-shot conversion of an indented JSON results list to JSON lines"""
+        try:
+            with open(legacy_path, 'rb') as f:
+                legacy_data = loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return
+        
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            for result in legacy_data:
+                f.write(_dump_line(result))
+        os.replace(tmp_path, filepath)
+        print(f"Migrated {len(legacy_data)} results from {legacy_path} to {filepath}")
+    
+    def _load_seen_keys(self, filepath: str) -> Set[str]:
+        """Stream the results file once to build the duplicate-check set"""
+        legacy_path = os.path.splitext(filepath)[0] + ".json"
+        if legacy_path != filepath and not os.path.exists(filepath) and os.path.exists(legacy_path):
+            self._migrate_legacy(legacy_path, filepath)
+        
+        seen = set()
+        try:
+            with open(filepath, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        seen.add(self._result_key(loads(line)))
+                    except ValueError:
+                        continue  # Torn line from an interrupted write
+        except FileNotFoundError:
+            pass
+        return seen
+    
     def save_results(self, results: List[Dict], filepath: str):
-        """Save results to JSON file"""
+        """Append new results to a JSON-lines file, skipping duplicates"""
         try:
-            # Load existing results
-            existing_data = []
-            try:
-                with open(filepath, 'r') as f:
-                    existing_data = json.load(f)
-            except FileNotFoundError:
-                existing_data = []
-            except json.JSONDecodeError:
-                existing_data = []
-            
-            # Append new results (avoid duplicates)
-            existing_match_keys = {
-                f"{r.get('team1', '')}_{r.get('team2', '')}_{r.get('timestamp', '')}"
-                for r in existing_data
-            }
-            
-            for result in results:
-                match_key = f"{result['team1']}_{result['team2']}_{result['timestamp']}"
-                if match_key not in existing_match_keys:
-                    existing_data.append(result)
+            if self._seen_keys is None:
+                self._seen_keys = self._load_seen_keys(filepath)
+            seen = self._seen_keys
             
-            # Save all results
-            with open(filepath, 'w') as f:
-                json.dump(existing_data, f, indent=2, default=str)
+            saved = 0
+            with open(filepath, 'ab') as f:
+                for result in results:
+                    match_key = self._result_key(result)
+                    if match_key in seen:
+                        continue
+                    seen.add(match_key)
+                    f.write(_dump_line(result))
+                    saved += 1
             
-            print(f"Saved {len(results)} new results to {filepath}")
+            print(f"Saved {saved} new results to {filepath}")
             
         except Exception as e:
             print(f"Error saving results: {e}")
     
+    def compact(self, filepath: str):
+        """Rewrite the results file without duplicates or torn lines"""
+        try:
+            seen = set()
+            kept = 0
+            tmp_path = filepath + ".tmp"
+            with open(filepath, 'rb') as src, open(tmp_path, 'wb') as dst:
+                for line in src:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        result = loads(line)
+                    except ValueError:
+                        continue
+                    match_key = self._result_key(result)
+                    if match_key in seen:
+                        continue
+                    seen.add(match_key)
+                    dst.write(_dump_line(result))
+                    kept += 1
+            os.replace(tmp_path, filepath)
+            self._seen_keys = seen
+            print(f"Compacted {filepath} to {kept} results")
+            
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error compacting results: {e}")
+    
     def run_scheduled(self, results_file: str):
         """Run results scraping on schedule"""
         
         def scheduled_task():
             try:
+                last_compact = time.monotonic()
                 while not self._stop_event.is_set():
-                    current_time = datetime.now()
+                    print("Starting scheduled results scrape...")
+                    results = self.scrape_results()
                     
-                    # Check if it's time to scrape
-                    if (self.last_scrape is None or 
-                        (current_time - self.last_scrape).total_seconds() >= self.scrape_interval):
-                        
-                        print("Starting scheduled results scrape...")
-                        results = self.scrape_results()
-                        
-                        if results:
-                            self.save_results(results, results_file)
-                        
-                        self.last_scrape = current_time
-                        print(f"Next results scrape at: {current_time + timedelta(seconds=self.scrape_interval)}")
+                    if results:
+                        self.save_results(results, results_file)
                     
-                    time.sleep(60)  # Check every minute
+                    self.last_scrape = datetime.now()
+                    
+                    if time.monotonic() - last_compact >= self.COMPACT_INTERVAL:
+                        self.compact(results_file)
+                        last_compact = time.monotonic()
+                    print(f"Next results scrape at: {self.last_scrape + timedelta(seconds=self.scrape_interval)}")
+                    
+                    # Sleep until the next scrape; returns early on stop()
+                    if self._stop_event.wait(self.scrape_interval):
+                        break
                     
             except Exception as e:
                 print(f"Error in scheduled results scraping: {e}")
@@ -0,0 +1,20 @@
+# selenium_helpers.py
+"""
+Selenium Helpers - Shared short-poll waits
+Used in place of fixed time.sleep() pads after clicks
+"""
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+def fast_wait(driver, condition, timeout: float = 5, poll: float = 0.1):
+    """
+    Wait for a post-condition with a short poll interval
+    
+    Returns:
+        The condition's value, or None if it did not hold within timeout
+    """
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+    except TimeoutException:
+        return None
@@ -4,11 +4,15 @@ Standings Scraper - Scrapes league standings
 Runs on schedule (every 30 minutes), read-only
 """
 
-import json
-import time
+import os
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from json_codec import dumps, loads
+from selenium_helpers import fast_wait
 
 class StandingsScraper:
     """Scrapes league standings on schedule"""
@@ -35,7 +39,10 @@ class StandingsScraper:
                 for tab in all_tabs:
                     if "Standings" in tab.text:
                         tab.click()
-                        time.sleep(2)
+                        fast_wait(
+                            self.driver,
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "div.virtual-standings"))
+                        )
                         break
                         
             return True
@@ -104,34 +111,38 @@ class StandingsScraper:
         return standings
     
     def save_standings(self, standings: Dict, filepath: str):
-        """Save standings to JSON file"""
+        """
+        Save standings to JSON file
+        
+        The file maps season -> standings ({"seasons": {...}, "updated": ...}),
+        so updating a season is a key assignment; it is replaced atomically.
+        """
         try:
             # Load existing standings
-            existing_data = []
             try:
-                with open(filepath, 'r') as f:
-                    existing_data = json.load(f)
-            except FileNotFoundError:
-                existing_data = []
-            except json.JSONDecodeError:
-                existing_data = []
+                with open(filepath, 'rb') as f:
+                    existing_data = loads(f.read())
+            except (FileNotFoundError, ValueError):
+                existing_data = {}
             
-            # Check if we already have this season's standings
-            season_exists = False
-            for existing in existing_data:
-                if existing.get("season") == standings.get("season"):
-                    # Update existing entry
-                    existing.update(standings)
-                    season_exists = True
-                    break
+            if isinstance(existing_data, list):
+                # Legacy layout: a list of per-season entries
+                seasons = {entry.get("season"): entry for entry in existing_data}
+            else:
+                seasons = existing_data.get("seasons", {})
             
-            # If new season, add it
-            if not season_exists:
-                existing_data.append(standings)
+            # Add or update this season's standings
+            seasons[standings.get("season")] = standings
+            data = {
+                "seasons": seasons,
+                "updated": datetime.now().isoformat()
+            }
             
-            # Save all standings
-            with open(filepath, 'w') as f:
-                json.dump(existing_data, f, indent=2, default=str)
+            # Save all standings via temp file + rename so a crash can't truncate it
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps(data, pretty=True))
+            os.replace(tmp_path, filepath)
             
             print(f"Saved standings to {filepath}")
             
@@ -144,22 +155,18 @@ class StandingsScraper:
         def scheduled_task():
             try:
                 while not self._stop_event.is_set():
-                    current_time = datetime.now()
+                    print("Starting scheduled standings scrape...")
+                    standings = self.scrape_standings()
                     
-                    # Check if it's time to scrape
-                    if (self.last_scrape is None or 
-                        (current_time - self.last_scrape).total_seconds() >= self.scrape_interval):
-                        
-                        print("Starting scheduled standings scrape...")
-                        standings = self.scrape_standings()
-                        
-                        if standings["teams"]:
-                            self.save_standings(standings, standings_file)
-                        
-                        self.last_scrape = current_time
-                        print(f"Next standings scrape at: {current_time + timedelta(seconds=self.scrape_interval)}")
+                    if standings["teams"]:
+                        self.save_standings(standings, standings_file)
                     
-                    time.sleep(60)  # Check every minute
+                    self.last_scrape = datetime.now()
+                    print(f"Next standings scrape at: {self.last_scrape + timedelta(seconds=self.scrape_interval)}")
+                    
+                    # Sleep until the next scrape; returns early on stop()
+                    if self._stop_event.wait(self.scrape_interval):
+                        break
                     
             except Exception as e:
                 print(f"Error in scheduled standings scraping: {e}")
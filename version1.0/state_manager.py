@@ -4,13 +4,16 @@ Central State Manager
 Manages match states and enforces one-way transitions
 """
 
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Set
-import json
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 import threading
 
+from json_codec import dumps, loads
+
 class MatchState(Enum):
     """Match states - one-way transitions only"""
     NOT_STARTED = "NOT_STARTED"
@@ -18,6 +21,20 @@ class MatchState(Enum):
     LIVE = "LIVE"
     FINISHED = "FINISHED"
 
+# Valid one-way transitions, built once
+_VALID_TRANSITIONS: Dict[MatchState, frozenset] = {
+    MatchState.NOT_STARTED: frozenset({MatchState.ODDS_SCRAPED, MatchState.LIVE}),
+    MatchState.ODDS_SCRAPED: frozenset({MatchState.LIVE}),
+    MatchState.LIVE: frozenset({MatchState.FINISHED}),
+    MatchState.FINISHED: frozenset()  # No transitions from FINISHED
+}
+
+# Most recent odds-scrape timestamps kept per match
+SCRAPED_AT_KEEP = 64
+
+# Stored state value -> MatchState, for bulk loading
+_STATES_BY_VALUE: Dict[str, MatchState] = {state.value: state for state in MatchState}
+
 @dataclass
 class MatchRecord:
     """Individual match record"""
@@ -27,9 +44,13 @@ class MatchRecord:
     team2: str
     state: MatchState = MatchState.NOT_STARTED
     odds: Dict[str, float] = field(default_factory=dict)
-    goals: List[int] = field(default_factory=list)
-    scraped_at: List[datetime] = field(default_factory=list)
+    # Goal minutes as unsigned bytes (0-255), one byte each instead of an int object
+    goals: array = field(default_factory=lambda: array('B'))
+    # Ring buffer: only the latest SCRAPED_AT_KEEP scrapes are kept
+    scraped_at: Deque[datetime] = field(default_factory=lambda: deque(maxlen=SCRAPED_AT_KEEP))
     last_updated: datetime = field(default_factory=datetime.now)
+    # Guards state/odds/goals mutation of this record only
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -39,19 +60,52 @@ class MatchRecord:
             "team1": self.team1,
             "team2": self.team2,
             "state": self.state.value,
-            "odds": self.odds,
-            "goals": self.goals,
+            "odds": dict(self.odds),
+            "goals": list(self.goals),
             "scraped_at": [dt.isoformat() for dt in self.scraped_at],
             "last_updated": self.last_updated.isoformat()
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MatchRecord":
+        """Build a record from to_dict() output in a single constructor call"""
+        fromisoformat = datetime.fromisoformat
+        last_updated = data.get("last_updated")
+        return cls(
+            match_id=data["match_id"],
+            league=data["league"],
+            team1=data["team1"],
+            team2=data["team2"],
+            state=_STATES_BY_VALUE[data["state"]],
+            odds=data.get("odds", {}),
+            # Same 0-255 range add_goal() accepts; anything else cannot be a byte
+            goals=array('B', (m for m in data.get("goals", ()) if 0 <= m <= 255)),
+            scraped_at=deque(
+                (fromisoformat(dt) for dt in data.get("scraped_at", ())),
+                maxlen=SCRAPED_AT_KEEP
+            ),
+            last_updated=fromisoformat(last_updated) if last_updated else datetime.now()
+        )
 
 class CentralStateManager:
-    """Manages state for all matches with thread safety"""
+    """
+    Manages state for all matches with thread safety
+    
+    self._lock guards only the indices (matches, league_states and the
+    caches built from them). Per-match changes take that record's own lock,
+    so updates to different matches never block each other.
+    """
     
     def __init__(self):
         self.matches: Dict[str, MatchRecord] = {}
         self.league_states: Dict[str, Set[str]] = {}  # league -> match_ids
-        self._lock = threading.RLock()
+        # league -> records in creation order; append-only, matches are never removed
+        self._league_match_list: Dict[str, List[MatchRecord]] = {}
+        self._lock = threading.Lock()
+        # Bumped whenever the set of matches changes; invalidates the team-pair index
+        self._version = 0
+        self._team_pair_index: Dict[Tuple[str, str], Optional[str]] = {}
+        self._team_pair_version = -1
         
     def create_match(self, match_id: str, league: str, team1: str, team2: str) -> MatchRecord:
         """Create new match record"""
@@ -61,70 +115,68 @@ class CentralStateManager:
                 
             match = MatchRecord(match_id, league, team1, team2)
             self.matches[match_id] = match
+            self._version += 1
             
             if league not in self.league_states:
                 self.league_states[league] = set()
             self.league_states[league].add(match_id)
+            self._league_match_list.setdefault(league, []).append(match)
             
             return match
     
+    @staticmethod
+    def _transition(match: MatchRecord, new_state: MatchState) -> bool:
+        """Apply a one-way state transition; caller holds match._lock"""
+        current_state = match.state
+        
+        if new_state in _VALID_TRANSITIONS[current_state]:
+            match.state = new_state
+            match.last_updated = datetime.now()
+            return True
+        else:
+            # Invalid transition - log but don't change
+            print(f"Invalid state transition: {current_state} -> {new_state}")
+            return False
+    
     def update_match_state(self, match_id: str, new_state: MatchState) -> bool:
         """Update match state with one-way transition enforcement"""
-        with self._lock:
-            if match_id not in self.matches:
-                return False
-                
-            match = self.matches[match_id]
-            current_state = match.state
-            
-            # Define valid transitions
-            valid_transitions = {
-                MatchState.NOT_STARTED: [MatchState.ODDS_SCRAPED, MatchState.LIVE],
-                MatchState.ODDS_SCRAPED: [MatchState.LIVE],
-                MatchState.LIVE: [MatchState.FINISHED],
-                MatchState.FINISHED: []  # No transitions from FINISHED
-            }
-            
-            if new_state in valid_transitions[current_state]:
-                match.state = new_state
-                match.last_updated = datetime.now()
-                return True
-            else:
-                # Invalid transition - log but don't change
-                print(f"Invalid state transition: {current_state} -> {new_state}")
-                return False
+        # Reading an existing key is atomic; no index lock needed
+        match = self.matches.get(match_id)
+        if match is None:
+            return False
+        
+        with match._lock:
+            return self._transition(match, new_state)
     
     def add_odds(self, match_id: str, market: str, odds: float) -> bool:
         """Add odds to match (only if not LIVE or FINISHED)"""
-        with self._lock:
-            if match_id not in self.matches:
-                return False
-                
-            match = self.matches[match_id]
-            
+        match = self.matches.get(match_id)
+        if match is None:
+            return False
+        
+        with match._lock:
             # Only add odds if match hasn't started
             if match.state in [MatchState.NOT_STARTED, MatchState.ODDS_SCRAPED]:
                 match.odds[market] = odds
                 match.scraped_at.append(datetime.now())
                 
                 if match.state == MatchState.NOT_STARTED:
-                    self.update_match_state(match_id, MatchState.ODDS_SCRAPED)
+                    self._transition(match, MatchState.ODDS_SCRAPED)
                     
                 return True
             return False
     
     def add_goal(self, match_id: str, minute: int) -> bool:
         """Add goal minute (append-only)"""
-        with self._lock:
-            if match_id not in self.matches:
-                return False
-                
-            match = self.matches[match_id]
-            
+        match = self.matches.get(match_id)
+        if match is None:
+            return False
+        
+        with match._lock:
             # Only add goals if match is LIVE
             if match.state == MatchState.LIVE:
-                # Avoid duplicates
-                if minute not in match.goals:
+                # Avoid duplicates; goals are stored as bytes, so 0-255 only
+                if 0 <= minute <= 255 and minute not in match.goals:
                     match.goals.append(minute)
                     match.last_updated = datetime.now()
                     return True
@@ -132,59 +184,87 @@ class CentralStateManager:
     
     def get_match(self, match_id: str) -> Optional[MatchRecord]:
         """Get match by ID"""
+        return self.matches.get(match_id)
+    
+    @staticmethod
+    def team_pair_key(team1: str, team2: str) -> Tuple[str, str]:
+        """Normalised lookup key for a pair of team names"""
+        return (team1.strip().casefold(), team2.strip().casefold())
+    
+    def find_match_by_teams(self, team1: str, team2: str) -> Optional[str]:
+        """
+        Find the match ID for a team pair
+        
+        Uses an index rebuilt only when matches are added. The newest match
+        wins when a pairing recurs across rounds. Names that don't match
+        exactly (e.g. shortened tracker names) fall back to a substring scan
+        once, and the answer is remembered until the matches change.
+        """
         with self._lock:
-            return self.matches.get(match_id)
+            if self._team_pair_version != self._version:
+                self._team_pair_index = {
+                    self.team_pair_key(match.team1, match.team2): match_id
+                    for match_id, match in self.matches.items()
+                }
+                self._team_pair_version = self._version
+            
+            index = self._team_pair_index
+            key = self.team_pair_key(team1, team2)
+            if key not in index:
+                index[key] = next(
+                    (match_id for match_id, match in reversed(self.matches.items())
+                     if team1 in match.team1 and team2 in match.team2),
+                    None
+                )
+            return index[key]
     
     def get_matches_by_league(self, league: str) -> List[MatchRecord]:
         """Get all matches for a league"""
         with self._lock:
-            match_ids = self.league_states.get(league, set())
-            return [self.matches[mid] for mid in match_ids if mid in self.matches]
+            return list(self._league_match_list.get(league, ()))
     
     def save_to_json(self, filepath: str):
         """Save all matches to JSON file"""
         with self._lock:
+            matches = []
+            for match in self.matches.values():
+                with match._lock:
+                    matches.append(match.to_dict())
+            
             data = {
-                "matches": [match.to_dict() for match in self.matches.values()],
+                "matches": matches,
                 "last_updated": datetime.now().isoformat()
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(dumps(data))
     
     def load_from_json(self, filepath: str):
         """Load matches from JSON file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = loads(f.read())
                 
             with self._lock:
                 self.matches.clear()
                 self.league_states.clear()
+                self._league_match_list.clear()
+                self._version += 1
                 
                 for match_data in data.get("matches", []):
-                    match = MatchRecord(
-                        match_id=match_data["match_id"],
-                        league=match_data["league"],
-                        team1=match_data["team1"],
-                        team2=match_data["team2"]
-                    )
-                    match.state = MatchState(match_data["state"])
-                    match.odds = match_data.get("odds", {})
-                    match.goals = match_data.get("goals", [])
-                    match.scraped_at = [
-                        datetime.fromisoformat(dt) 
-                        for dt in match_data.get("scraped_at", [])
-                    ]
-                    match.last_updated = datetime.fromisoformat(
-                        match_data.get("last_updated", datetime.now().isoformat())
-                    )
+                    try:
+                        match = MatchRecord.from_dict(match_data)
+                    except (KeyError, TypeError, ValueError, OverflowError) as e:
+                        # Skip just the malformed record, keep loading the rest
+                        print(f"Skipping bad match record {match_data.get('match_id')}: {e}")
+                        continue
                     
                     self.matches[match.match_id] = match
                     
                     if match.league not in self.league_states:
                         self.league_states[match.league] = set()
                     self.league_states[match.league].add(match.match_id)
+                    self._league_match_list.setdefault(match.league, []).append(match)
                     
         except FileNotFoundError:
             print(f"State file {filepath} not found. Starting fresh.")
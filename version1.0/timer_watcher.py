@@ -5,27 +5,37 @@ Authoritative for timing decisions
 """
 
 import re
+import threading
 from datetime import datetime, timedelta
-import time
 from typing import Callable, Optional
-from selenium.webdriver.common.by import By
+
+# Active timer text in a single round-trip (null when the timer is missing)
+TIMER_TEXT_JS = """
+const el = document.querySelector('div.virtual-timer div.ss.active');
+return el ? el.innerText.trim() : null;
+"""
 
 class TimerWatcher:
     """Monitors the round timer and controls scraping windows"""
     
+    # Round start window and scraping deadline, in seconds remaining
+    ROUND_START_MIN = 118
+    SCRAPING_DEADLINE = 10
+    
     def __init__(self, driver):
         self.driver = driver
         self.current_time = None
         self.round_start_time = None
         self.last_round_start = None
+        self._stop_event = threading.Event()
         
     def get_timer_seconds(self) -> Optional[int]:
         """Extract timer value in seconds from DOM"""
         try:
-            timer_element = self.driver.find_element(
-                By.CSS_SELECTOR, "div.virtual-timer div.ss.active"
-            )
-            timer_text = timer_element.text.strip()
+            timer_text = self.driver.execute_script(TIMER_TEXT_JS)
+            if timer_text is None:
+                print("Error reading timer: timer not found")
+                return None
             
             # Parse MM:SS format
             if ':' in timer_text:
@@ -39,9 +49,13 @@ class TimerWatcher:
             print(f"Error reading timer: {e}")
             return None
     
-    def is_round_start(self) -> bool:
-        """Check if we're at the start of a new round (~120s)"""
-        current_time = self.get_timer_seconds()
+    def is_round_start(self, current_time: Optional[int] = None) -> bool:
+        """
+        Check if we're at the start of a new round (~120s)
+        Pass an already-read timer value to skip a second DOM read
+        """
+        if current_time is None:
+            current_time = self.get_timer_seconds()
         
         if current_time is None:
             return False
@@ -74,38 +88,62 @@ class TimerWatcher:
         # Scraping stops at 10 seconds remaining
         return current_time > 10
     
+    def _next_interval(self, current_seconds: Optional[int], check_interval: float) -> float:
+        """
+        Seconds until the next timer read
+        
+        Between the round-start window and the deadline nothing can fire, so
+        sleep until just before the deadline instead of ticking every second.
+        """
+        if current_seconds is None:
+            return check_interval
+        if self.SCRAPING_DEADLINE < current_seconds < self.ROUND_START_MIN:
+            # Wake one tick early to absorb timer drift
+            return max(check_interval, current_seconds - self.SCRAPING_DEADLINE - 2 * check_interval)
+        return check_interval
+    
     def monitor_timer(self, 
                      on_round_start: Callable,
                      on_scraping_deadline: Callable,
                      check_interval: float = 1.0):
         """
-        Monitor timer continuously
+        Monitor timer in a background thread
         Triggers callbacks based on timer events
         """
-        last_round_start_state = False
         
-        try:
-            while True:
-                current_seconds = self.get_timer_seconds()
-                
-                if current_seconds is not None:
-                    # Check for round start
-                    is_start = self.is_round_start()
-                    if is_start and not last_round_start_state:
-                        print(f"Round start detected at {current_seconds}s")
-                        on_round_start()
-                        last_round_start_state = True
-                    elif not is_start:
-                        last_round_start_state = False
+        def monitor_task():
+            last_round_start_state = False
+            
+            try:
+                while not self._stop_event.is_set():
+                    current_seconds = self.get_timer_seconds()
                     
-                    # Check for scraping deadline
-                    if current_seconds <= 10:
-                        print(f"Scraping deadline reached: {current_seconds}s remaining")
-                        on_scraping_deadline()
-                
-                time.sleep(check_interval)
-                
-        except KeyboardInterrupt:
-            print("Timer monitoring stopped")
-        except Exception as e:
-            print(f"Error in timer monitoring: {e}")
\ No newline at end of file
+                    if current_seconds is not None:
+                        # Check for round start
+                        is_start = self.is_round_start(current_seconds)
+                        if is_start and not last_round_start_state:
+                            print(f"Round start detected at {current_seconds}s")
+                            on_round_start()
+                            last_round_start_state = True
+                        elif not is_start:
+                            last_round_start_state = False
+                        
+                        # Check for scraping deadline
+                        if current_seconds <= self.SCRAPING_DEADLINE:
+                            print(f"Scraping deadline reached: {current_seconds}s remaining")
+                            on_scraping_deadline()
+                    
+                    self._stop_event.wait(self._next_interval(current_seconds, check_interval))
+                    
+            except Exception as e:
+                print(f"Error in timer monitoring: {e}")
+        
+        thread = threading.Thread(target=monitor_task)
+        thread.daemon = True
+        thread.start()
+        
+        return thread
+    
+    def stop(self):
+        """Stop timer monitoring"""
+        self._stop_event.set()
\ No newline at end of file
@@ -1,14 +1,29 @@
 import time
 import json
 import sqlite3
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import ElementClickInterceptedException, NoSuchElementException, StaleElementReferenceException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options  # Import Options for headless mode
+import asyncio
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+URL = 'https://odibets.com/odileague'
+TIMESTAMP_COUNT = 5  # Scrape data for the first 5 timestamps
+MAX_CONCURRENT_PAGES = 3
+
+# Every match in the current view as [data-id, home, away, {market: odds}], in one call.
+# Matches missing a team or an odds label/value are skipped, as before
+MATCHES_JS = """
+() => Array.from(document.querySelectorAll('.game.e')).map(match => {
+    const teams = match.querySelectorAll('.t-l');
+    if (teams.length < 2) return null;
+    const odds = {};
+    for (const button of match.querySelectorAll('.odds button')) {
+        const market = button.querySelector('small');
+        const value = button.querySelector('span.o-2');
+        if (!market || !value) return null;
+        odds[market.innerText] = value.innerText;
+    }
+    return [match.getAttribute('data-id'), teams[0].innerText, teams[1].innerText, odds];
+}).filter(row => row !== null)
+"""
 
 # Initialize the database
 def init_db():
@@ -56,111 +71,120 @@ def init_db():
 
 init_db()
 
-# Function to save the odds in the database
-def save_odds(match_data, odds_dict, market_name):
-    conn = sqlite3.connect('odibets_v2.db')
-    cursor = conn.cursor()
+# Row IDs already looked up this run (external_id -> match_id, name -> market_type_id)
+match_ids = {}
+market_type_ids = {}
 
+# Function to save the odds in the database
+# Uses the caller's cursor and only queues the tick row; the caller inserts
+# all ticks with executemany and commits once per scrape pass
+def save_odds(cursor, match_data, odds_dict, market_name, ticks):
     # Ensure match exists and get ID
-    cursor.execute('''
-        INSERT OR IGNORE INTO matches (external_id, team_home, team_away, league)
-        VALUES (?, ?, ?, ?)
-    ''', (match_data['id'], match_data['home'], match_data['away'], match_data['league']))
-    
-    cursor.execute('SELECT match_id FROM matches WHERE external_id = ?', (match_data['id'],))
-    m_id = cursor.fetchone()[0]
+    m_id = match_ids.get(match_data['id'])
+    if m_id is None:
+        cursor.execute('''
+            INSERT OR IGNORE INTO matches (external_id, team_home, team_away, league)
+            VALUES (?, ?, ?, ?)
+        ''', (match_data['id'], match_data['home'], match_data['away'], match_data['league']))
+        
+        cursor.execute('SELECT match_id FROM matches WHERE external_id = ?', (match_data['id'],))
+        m_id = match_ids[match_data['id']] = cursor.fetchone()[0]
 
     # Ensure market type exists
-    cursor.execute('INSERT OR IGNORE INTO market_types (name) VALUES (?)', (market_name,))
-    cursor.execute('SELECT market_type_id FROM market_types WHERE name = ?', (market_name,))
-    mt_id = cursor.fetchone()[0]
+    mt_id = market_type_ids.get(market_name)
+    if mt_id is None:
+        cursor.execute('INSERT OR IGNORE INTO market_types (name) VALUES (?)', (market_name,))
+        cursor.execute('SELECT market_type_id FROM market_types WHERE name = ?', (market_name,))
+        mt_id = market_type_ids[market_name] = cursor.fetchone()[0]
 
     # Record the "Tick" (Snapshot)
-    cursor.execute('''
-        INSERT INTO odds_ticks (match_id, market_type_id, timestamp, odds_data)
-        VALUES (?, ?, ?, ?)
-    ''', (m_id, mt_id, int(time.time()), json.dumps(odds_dict)))
-
-    conn.commit()
-    conn.close()
+    ticks.append((m_id, mt_id, int(time.time()), json.dumps(odds_dict)))
+
+# Scrape one timestamp in its own page; the semaphore bounds the open pages
+async def scrape_timestamp(index, context, sem):
+    async with sem:
+        page = await context.new_page()
+        try:
+            await page.goto(URL)
+            await page.wait_for_selector('.ss')
+
+            # Fewer timestamps than TIMESTAMP_COUNT on the page - nothing to click
+            # (clicking a missing one would hold a semaphore slot until the timeout)
+            if index >= await page.locator('.ss').count():
+                return []
+
+            # Wait for any overlay or modal to disappear (if present)
+            await page.wait_for_selector('.modal', state='detached')
+
+            # Remember a current match card so we can tell when the view re-renders
+            previous = await page.query_selector('.game.e')
+
+            # click() scrolls into view and waits for the timestamp to be clickable
+            await page.locator('.ss').nth(index).click()
+
+            if previous is not None:
+                try:
+                    await previous.wait_for_element_state('hidden', timeout=2000)
+                except PlaywrightTimeoutError:
+                    pass  # View did not re-render (timestamp was already selected)
+            await page.wait_for_selector('.game.e')
+
+            # Now, scrape the match data for this timestamp
+            return await page.evaluate(MATCHES_JS)
+        except Exception as e:
+            print(f"Error scraping timestamp {index + 1}: {e}")
+            return []
+        finally:
+            await page.close()
 
 # Function to start the web scraping
-def scrape_odds():
-    # Setup Chrome options for headless mode
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Enables headless mode
-    chrome_options.add_argument("--no-sandbox")  # For Linux environments
-    chrome_options.add_argument("--disable-dev-shm-usage")  # For Linux environments
-
-    # Setup the browser and open the page
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-    driver.get('https://odibets.com/odileague')
-
-    # Wait for the page to load
-    time.sleep(5)
+async def scrape_odds():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            # One browser and one context shared by all timestamp pages
+            context = await browser.new_context()
+            sem = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+            per_timestamp = await asyncio.gather(
+                *(scrape_timestamp(i, context, sem) for i in range(TIMESTAMP_COUNT))
+            )
+        finally:
+            await browser.close()
+
+    # Single writer: one connection and one transaction for the whole scrape pass
+    conn = sqlite3.connect('odibets_v2.db')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    cursor = conn.cursor()
+    ticks = []
 
     try:
-        # Scrape data for the first 5 timestamps
-        timestamps = driver.find_elements(By.CSS_SELECTOR, '.ss')[:5]
-        
-        for i, timestamp in enumerate(timestamps):
-            try:
-                # Scroll into view and click on the timestamp
-                driver.execute_script("arguments[0].scrollIntoView();", timestamp)
-
-                # Wait for any overlay or modal to disappear (if present)
-                WebDriverWait(driver, 10).until_not(EC.presence_of_element_located((By.CSS_SELECTOR, '.modal')))
-                
-                # Wait for the timestamp to be clickable
-                WebDriverWait(driver, 10).until(EC.element_to_be_clickable(timestamp))
-
-                timestamp.click()
-                time.sleep(2)  # Give time for the data to load
-
-                # Now, scrape the match data for this timestamp
-                matches = driver.find_elements(By.CSS_SELECTOR, '.game.e')
-
-                for match in matches:
-                    try:
-                        # Scrape match data (team names, odds, etc.)
-                        team_home = match.find_element(By.CSS_SELECTOR, '.t-l').text
-                        team_away = match.find_elements(By.CSS_SELECTOR, '.t-l')[1].text
-                        league = 'OdiLeague'  # This could be dynamic if needed
-                        match_id = match.get_attribute('data-id')  # Assuming each match has a unique 'data-id'
-                        
-                        odds_buttons = match.find_elements(By.CSS_SELECTOR, '.odds button')
-                        odds_dict = {}
-                        for button in odds_buttons:
-                            market_type = button.find_element(By.CSS_SELECTOR, 'small').text
-                            odds_value = button.find_element(By.CSS_SELECTOR, 'span.o-2').text
-                            odds_dict[market_type] = odds_value
-
-                        # Store the data in the database
-                        match_data = {
-                            'id': match_id,
-                            'home': team_home,
-                            'away': team_away,
-                            'league': league
-                        }
-                        save_odds(match_data, odds_dict, '1X2')  # '1X2' is the market type in this example
-
-                    except Exception as e:
-                        print(f"Error scraping match data: {e}")
-            except ElementClickInterceptedException:
-                print(f"Error: Element click intercepted at timestamp {i + 1}")
-            except StaleElementReferenceException:
-                print(f"Error: Stale element reference at timestamp {i + 1}")
-            except NoSuchElementException:
-                print(f"Error: No such element found at timestamp {i + 1}")
-            except Exception as e:
-                print(f"Error scraping timestamp {i + 1}: {e}")
-
-    except Exception as e:
-        print(f"Error scraping timestamps: {e}")
+        for rows in per_timestamp:
+            for match_id, team_home, team_away, odds_dict in rows:
+                try:
+                    # Store the data in the database
+                    match_data = {
+                        'id': match_id,
+                        'home': team_home,
+                        'away': team_away,
+                        'league': 'OdiLeague'  # This could be dynamic if needed
+                    }
+                    save_odds(cursor, match_data, odds_dict, '1X2', ticks)  # '1X2' is the market type in this example
+
+                except Exception as e:
+                    print(f"Error saving match data: {e}")
 
     finally:
+        # Flush every queued tick in one statement and commit once
+        cursor.executemany('''
+            INSERT INTO odds_ticks (match_id, market_type_id, timestamp, odds_data)
+            VALUES (?, ?, ?, ?)
+        ''', ticks)
+        conn.commit()
+        conn.close()
+        print(f"Saved {len(ticks)} odds ticks")
+
         print("Scraping complete!")
-        driver.quit()
 
 # Start the scraping process
-scrape_odds()
+asyncio.run(scrape_odds())
\ No newline at end of file
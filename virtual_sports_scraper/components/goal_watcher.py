@@ -1,8 +1,16 @@
 import time
-from selenium.webdriver.common.by import By
+from collections import deque
 from config.selectors import GOAL_EVENT
 import logging
 
+# Trimmed text of every goal alert on the page, in one round-trip
+GOAL_TEXTS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(e => e.textContent.trim());
+"""
+
+# Goal texts remembered for duplicate detection
+RECENT_GOALS_KEEP = 256
+
 class GoalWatcher:
     """
     Monitors for goal events during LIVE match.
@@ -12,17 +20,22 @@ class GoalWatcher:
         self.driver = driver
         self.storage = data_storage
         self.match_id = match_id
-        self.captured_goals = set() # Avoid duplicates in memory for this session
+        # Bounded window of captured goals (deque for order, set for lookups)
+        self._recent = deque(maxlen=RECENT_GOALS_KEEP)
+        self._recent_set = set()
 
     def check_for_goals(self):
         """Scans for new goal alerts."""
         try:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, GOAL_EVENT)
-            for el in elements:
-                text = el.text.strip()
-                if text and text not in self.captured_goals:
+            texts = self.driver.execute_script(GOAL_TEXTS_JS, GOAL_EVENT)
+            for text in texts:
+                if text and text not in self._recent_set:
                     logging.info(f"New Goal Detected: {text}")
-                    self.captured_goals.add(text)
+                    if len(self._recent) == self._recent.maxlen:
+                        # The deque drops its oldest entry on append - evict it from the set too
+                        self._recent_set.discard(self._recent[0])
+                    self._recent.append(text)
+                    self._recent_set.add(text)
                     
                     goal_data = {
                         "match_id": self.match_id,
@@ -1,9 +1,21 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from config.selectors import LEAGUE_DROPDOWN, LEAGUE_OPTION_TEMPLATE
+from selenium.common.exceptions import TimeoutException
+from config.selectors import LEAGUE_DROPDOWN, LEAGUE_OPTION_TEMPLATE, LEAGUE_LOGO
 import logging
-import time
+
+# Finds the first logo whose text contains the (lowercased) league name,
+# scrolls it into view and clicks it - one round-trip. Returns the logo or null.
+SELECT_LEAGUE_JS = """
+const name = arguments[1];
+const logo = Array.from(document.querySelectorAll(arguments[0]))
+    .find(el => el.innerText.trim().toLowerCase().includes(name));
+if (!logo) return null;
+logo.scrollIntoView(true);
+logo.click();
+return logo;
+"""
 
 class LeagueScraper:
     """
@@ -23,24 +35,22 @@ class LeagueScraper:
             
             # Wait for logos to be present
             WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".virtual-logos .logo"))
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, LEAGUE_LOGO))
             )
             
-            # Find the specific logo for the league
-            # We look for the text inside the logo container
-            logos = self.driver.find_elements(By.CSS_SELECTOR, ".virtual-logos .logo")
-            
-            target_logo = None
-            for logo in logos:
-                if league_name.lower() in logo.text.strip().lower():
-                    target_logo = logo
-                    break
+            # Find, scroll to and click the matching logo in the page itself
+            target_logo = self.driver.execute_script(
+                SELECT_LEAGUE_JS, LEAGUE_LOGO, league_name.lower()
+            )
             
             if target_logo:
-                # scroll into view if needed
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", target_logo)
-                time.sleep(0.5)
-                target_logo.click()
+                # The selected logo is marked active once the league has switched
+                try:
+                    WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                        lambda d: "active" in (target_logo.get_attribute("class") or "")
+                    )
+                except TimeoutException:
+                    logging.warning(f"League {league_name} clicked but not marked active yet")
                 logging.info(f"Successfully selected {league_name}")
                 return True
             else: